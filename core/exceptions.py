@@ -2,11 +2,20 @@
 This module defines custom exceptions for the file converter application.
 Using custom exceptions allows for more specific error handling and clearer
 intent than relying solely on built-in Python exceptions.
+
+The exceptions store only their raw fields when raised; the human-readable
+message is formatted on demand by __str__, so errors that are caught and
+discarded never pay for string formatting.
 """
 
 class ConverterError(Exception):
     """Base exception class for all application-specific errors."""
-    pass
+    __slots__ = ()
+
+    @property
+    def message(self):
+        """str: The fully formatted explanation of the error."""
+        return str(self)
 
 class UnsupportedFormatError(ConverterError):
     """
@@ -16,10 +25,15 @@ class UnsupportedFormatError(ConverterError):
         format (str): The unsupported file format/extension.
         message (str): Explanation of the error.
     """
+    __slots__ = ('format', '_base_msg')
+
     def __init__(self, format, message="The file format is not supported."):
         self.format = format
-        self.message = f"{message}: '{self.format}'"
-        super().__init__(self.message)
+        self._base_msg = message
+        super().__init__(format, message)
+
+    def __str__(self):
+        return f"{self._base_msg}: '{self.format}'"
 
 class ConversionError(ConverterError):
     """
@@ -31,19 +45,28 @@ class ConversionError(ConverterError):
         to_format (str): The target format.
         message (str): Explanation of the error.
     """
+    __slots__ = ('from_format', 'to_format', '_base_msg')
+
     def __init__(self, from_format, to_format, message="An error occurred during conversion."):
         self.from_format = from_format
         self.to_format = to_format
-        self.message = f"{message} (from {from_format} to {to_format})"
-        super().__init__(self.message)
+        self._base_msg = message
+        super().__init__(from_format, to_format, message)
+
+    def __str__(self):
+        return f"{self._base_msg} (from {self.from_format} to {self.to_format})"
 
 class FileProcessingError(ConverterError):
     """
     Raised for general errors during file reading or writing, such as
     permission errors or corrupted files.
     """
+    __slots__ = ('file_path', '_base_msg')
+
     def __init__(self, file_path, message="Failed to process file."):
         self.file_path = file_path
-        self.message = f"{message}: {self.file_path}"
-        super().__init__(self.message)
+        self._base_msg = message
+        super().__init__(file_path, message)
 
+    def __str__(self):
+        return f"{self._base_msg}: {self.file_path}"
@@ -7,42 +7,139 @@ and manages the data flow between them.
 """
 
 import os
+import shutil
+import logging
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Number of intermediate records handed to a writer per write_batches() call.
+BATCH_SIZE = 8192
+
+# The fewest conversions worth spreading over worker processes.
+PARALLEL_MIN_JOBS = 4
+
 # Try both relative and absolute imports to support different use cases
 try:
-    from ..plugins.handler_factory import get_handler
+    from ..plugins.handler_factory import get_handler_or_none, supports
+    from ..plugins.base_handler import FileHandler
     from .exceptions import ConversionError, UnsupportedFormatError, FileProcessingError
+    from .parallel import process_map
 except ImportError:
+    # Absolute imports for installed package or when run from the project root
+    from plugins.handler_factory import get_handler_or_none, supports
+    from plugins.base_handler import FileHandler
+    from core.exceptions import ConversionError, UnsupportedFormatError, FileProcessingError
+    from core.parallel import process_map
+
+
+def _format_of(path: str) -> str:
+    """
+    Returns the lowercase extension of a path without the leading dot, or
+    an empty string if the file name has none. A single rpartition is used
+    instead of os.path.splitext because this runs on every conversion.
+    """
+    _, dot, ext = path.rpartition('.')
+    if not dot or '/' in ext or '\\' in ext:
+        # No dot at all, or the last dot belongs to a directory name
+        return ''
+    return ext.lower()
+
+
+def _batched(records: Iterator[Dict[str, Any]], size: int = BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Groups a stream of intermediate records into lists of at most `size`.
+    """
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _format_unsupported(input_format: str, output_format: str, unsupported: str) -> ConversionError:
+    """
+    Builds the error reported when no handler can be had for one side of a
+    conversion. The caller raises it directly, so no lower-level exception
+    is created and wrapped on this path.
+    """
+    if supports(unsupported):
+        # Registered, but its plugin module failed to import
+        message = (f"The handler for this file type could not be loaded; "
+                   f"are its dependencies installed? '{unsupported}'")
+    else:
+        message = f"No handler registered for this file type: '{unsupported}'"
+    return ConversionError(from_format=input_format, to_format=output_format, message=message)
+
+
+def _check_input(input_path: str):
+    """
+    Fails fast on a missing input before any handler work is done.
+    """
+    if not os.path.isfile(input_path):
+        raise FileProcessingError(input_path, "Input file does not exist")
+
+
+def _resolve_handlers(input_format: str, output_format: str) -> Tuple[FileHandler, FileHandler]:
+    """
+    Returns the (reader, writer) handlers for a format pair.
+
+    A miss is an ordinary outcome here, so it is checked with a branch
+    instead of catching the factory's UnsupportedFormatError.
+    """
+    reader_handler = get_handler_or_none(input_format)
+    if reader_handler is None:
+        raise _format_unsupported(input_format, output_format, input_format)
+
+    writer_handler = get_handler_or_none(output_format)
+    if writer_handler is None:
+        raise _format_unsupported(input_format, output_format, output_format)
+
+    log.debug("Using reader: %s, writer: %s", type(reader_handler).__name__, type(writer_handler).__name__)
+    return reader_handler, writer_handler
+
+
+def _copy(input_path: str, output_path: str, input_format: str, output_format: str):
+    """
+    Copies a file whose bytes are already in the target format. shutil uses
+    sendfile where available, so no parsing or re-serializing happens.
+    """
+    log.debug("Formats match, copying file directly")
     try:
-        # Try absolute imports for installed package
-        from plugins.handler_factory import get_handler
-        from core.exceptions import ConversionError, UnsupportedFormatError, FileProcessingError
-    except ImportError:
-        # For standalone testing, we'll define dummy versions.
-        class UnsupportedFormatError(Exception): pass
-        class ConversionError(Exception):
-            def __init__(self, from_format=None, to_format=None, message="An error occurred during conversion."):
-                self.from_format = from_format
-                self.to_format = to_format
-                self.message = f"{message} (from {from_format} to {to_format})"
-                super().__init__(self.message)
-        class FileProcessingError(Exception):
-            def __init__(self, path, msg):
-                super().__init__(f"{msg}: {path}")
-
-        class FileHandler:
-            def read(self, file_path):
-                print(f"Reading from {file_path} using {type(self).__name__}")
-                return [{"id": 1, "data": "sample"}, {"id": 2, "data": "demo"}]
-
-            def write(self, file_path, data):
-                print(f"Writing to {file_path} using {type(self).__name__}")
-                print(f"Data received: {data}")
-
-        def get_handler(ext):
-            if ext in ['csv', 'json']:
-                # In a real scenario, this returns CsvHandler() or JsonHandler()
-                return FileHandler()
-            raise UnsupportedFormatError(f"No handler for {ext}")
+        shutil.copyfile(input_path, output_path)
+    except OSError as e:
+        raise ConversionError(
+            from_format=input_format,
+            to_format=output_format,
+            message=f"Could not copy file: {e}"
+        ) from e
+
+
+def _transfer(reader_handler: FileHandler, writer_handler: FileHandler,
+              input_path: str, output_path: str, input_format: str, output_format: str):
+    """
+    Streams the input through the intermediate format into the output.
+    """
+    try:
+        # 3. Read the data into the intermediate format, one batch at a time
+        records = reader_handler.iter_read(input_path)
+        first_batch = list(islice(records, BATCH_SIZE))
+
+        # 4. Write the data to the new file. When the whole input fits in a
+        # single batch, skip the batching layer and write the list directly.
+        if len(first_batch) < BATCH_SIZE:
+            writer_handler.write(output_path, first_batch)
+        else:
+            writer_handler.write_batches(output_path, chain([first_batch], _batched(records)))
+
+    except (UnsupportedFormatError, FileProcessingError) as e:
+        # Re-raise specific errors from lower levels with more context
+        raise ConversionError(
+            from_format=input_format,
+            to_format=output_format,
+            message=f"A handler error occurred: {e}"
+        ) from e
 
 
 def convert_file(input_path: str, output_path: str):
@@ -54,55 +151,129 @@ def convert_file(input_path: str, output_path: str):
         output_path (str): The full path where the converted file will be saved.
 
     Raises:
-        ConversionError: If any step in the conversion process fails.
-        UnsupportedFormatError: If the input or output format is not supported.
+        ConversionError: If any step in the conversion process fails,
+                         including when the input or output format is
+                         not supported.
+        FileProcessingError: If the input file does not exist.
+
+    Other exceptions raised by a handler, such as ValueError for empty
+    data, propagate unchanged.
     """
-    print(f"Starting conversion from '{input_path}' to '{output_path}'...")
+    log.debug("Starting conversion from '%s' to '%s'...", input_path, output_path)
 
-    try:
-        # 1. Determine file formats from extensions
-        _, input_ext = os.path.splitext(input_path)
-        _, output_ext = os.path.splitext(output_path)
-        input_format = input_ext.lstrip('.').lower()
-        output_format = output_ext.lstrip('.').lower()
+    # 1. Determine file formats from extensions
+    input_format = _format_of(input_path)
+    output_format = _format_of(output_path)
+
+    if not input_format or not output_format:
+        raise ConversionError(input_format, output_format, "Could not determine file formats from paths.")
 
-        if not input_format or not output_format:
-            raise ConversionError(input_format, output_format, "Could not determine file formats from paths.")
+    log.debug("Source format: '%s', Target format: '%s'", input_format, output_format)
 
-        print(f"Source format: '{input_format}', Target format: '{output_format}'")
+    _check_input(input_path)
 
+    if input_format == output_format and supports(input_format):
+        _copy(input_path, output_path, input_format, output_format)
+    else:
         # 2. Get the appropriate handlers from the factory
-        reader_handler = get_handler(input_format)
-        writer_handler = get_handler(output_format)
-        
-        print(f"Using reader: {type(reader_handler).__name__}, writer: {type(writer_handler).__name__}")
+        reader_handler, writer_handler = _resolve_handlers(input_format, output_format)
+        _transfer(reader_handler, writer_handler, input_path, output_path, input_format, output_format)
 
-        # 3. Read the data into the intermediate format
-        intermediate_data = reader_handler.read(input_path)
+    log.debug("Conversion completed successfully!")
 
-        # 4. Write the data from the intermediate format to the new file
-        writer_handler.write(output_path, intermediate_data)
 
-    except (UnsupportedFormatError, FileProcessingError) as e:
-        # Re-raise specific errors from lower levels with more context
-        raise ConversionError(
-            from_format=input_format,
-            to_format=output_format,
-            message=f"A handler error occurred: {e}"
-        ) from e
+def make_converter(input_ext: str, output_ext: str) -> Callable[[str, str], None]:
+    """
+    Resolves the conversion plan for a format pair once and returns a
+    function that applies it to many files.
+
+    Extension parsing and handler lookup happen here rather than on every
+    call, which suits batch drivers converting many files of one kind.
+
+    Args:
+        input_ext (str): The source format, with or without the leading dot.
+        output_ext (str): The target format, with or without the leading dot.
+
+    Returns:
+        Callable[[str, str], None]: A function taking (input_path, output_path)
+                                    that behaves like convert_file().
+
+    Raises:
+        ConversionError: If either format is not supported.
+    """
+    input_format = input_ext.lstrip('.').lower()
+    output_format = output_ext.lstrip('.').lower()
+
+    if not input_format or not output_format:
+        raise ConversionError(input_format, output_format, "Could not determine file formats from paths.")
+
+    if input_format == output_format and supports(input_format):
+        def _run(input_path: str, output_path: str):
+            _check_input(input_path)
+            _copy(input_path, output_path, input_format, output_format)
+        return _run
+
+    reader_handler, writer_handler = _resolve_handlers(input_format, output_format)
+
+    def _run(input_path: str, output_path: str):
+        _check_input(input_path)
+        _transfer(reader_handler, writer_handler, input_path, output_path, input_format, output_format)
+    return _run
+
+
+# Conversion plans built by _run_job(), by format pair. Each worker process
+# of convert_many() fills its own.
+_CONVERTERS: Dict[Tuple[str, str], Callable[[str, str], None]] = {}
+
+
+def _run_job(job: Tuple[str, str]) -> Optional[str]:
+    """
+    Runs one (input_path, output_path) conversion, reusing the plan for its
+    format pair, and returns None on success or the error message.
+
+    Errors are returned as text rather than raised because this runs in
+    worker processes, and not every handler exception can be pickled back.
+    """
+    input_path, output_path = job
+    try:
+        formats = (_format_of(input_path), _format_of(output_path))
+        run = _CONVERTERS.get(formats)
+        if run is None:
+            run = _CONVERTERS[formats] = make_converter(*formats)
+        run(input_path, output_path)
+        return None
     except Exception as e:
-        # Catch any other unexpected errors
-        raise ConversionError(
-            from_format=input_format,
-            to_format=output_format,
-            message=f"An unexpected error occurred: {e}"
-        ) from e
+        return str(e)
 
-    print("Conversion completed successfully!")
+
+def convert_many(jobs: List[Tuple[str, str]], workers: Optional[int] = None) -> Iterator[Optional[str]]:
+    """
+    Runs many conversions, spreading them over a pool of worker processes
+    so that a batch uses every core.
+
+    Each worker resolves a format pair's handlers once and reuses them for
+    every later job of that pair. Handlers that would spread one file over
+    several processes, such as PDF and AZW3 readers, work in-process inside
+    these workers. Batches of fewer than PARALLEL_MIN_JOBS
+    conversions, or systems where worker processes cannot be started, are
+    run in this process.
+
+    Args:
+        jobs (List[Tuple[str, str]]): The (input_path, output_path) pairs to convert.
+        workers (Optional[int]): The number of worker processes; defaults
+                                 to the number of CPUs.
+
+    Returns:
+        Iterator[Optional[str]]: For each job, in order and as soon as it
+                                 is done, None on success or the error message.
+    """
+    return process_map(_run_job, jobs, min_jobs=PARALLEL_MIN_JOBS, workers=workers)
 
 
 # Example Usage (for demonstration):
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Create dummy files for the example
     with open("input.csv", "w") as f:
         f.write("id,data\n1,sample\n2,demo")
@@ -110,7 +281,7 @@ if __name__ == '__main__':
     try:
         # Simulate a successful conversion
         convert_file("input.csv", "output.json")
-    except (ConversionError, UnsupportedFormatError) as e:
+    except (ConversionError, FileProcessingError) as e:
         print(f"ERROR: {e}")
     
     print("\n" + "="*20 + "\n")
@@ -118,7 +289,7 @@ if __name__ == '__main__':
     try:
         # Simulate a failed conversion (unsupported format)
         convert_file("input.csv", "output.xml")
-    except (ConversionError, UnsupportedFormatError) as e:
+    except ConversionError as e:
         print(f"CAUGHT EXPECTED ERROR: {e}")
 
     # Clean up dummy file
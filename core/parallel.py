@@ -0,0 +1,90 @@
+"""
+Runs independent pieces of work over a pool of worker processes.
+
+Used wherever a conversion splits into parts that can be done on separate
+cores (the pages of a PDF, the chapters of an ebook, the files of a batch),
+so that the decision to start workers and the fallback when they cannot be
+started are made in one place.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+
+# Set in the worker processes started by process_map(), whose own calls to
+# it then run in-process: nested pools would start a worker per CPU inside
+# each worker, CPU-count squared processes in all.
+_IN_WORKER = False
+
+
+def _mark_worker():
+    """
+    Marks the current process as a process_map() worker.
+    """
+    global _IN_WORKER
+    _IN_WORKER = True
+
+
+def available_workers() -> int:
+    """
+    Returns the number of worker processes process_map() uses by default:
+    one per CPU, or 1 inside one of its own workers, where the CPUs are
+    already in use.
+    """
+    if _IN_WORKER:
+        return 1
+    return os.cpu_count() or 1
+
+
+def process_map(fn: Callable[..., Any], *sequences: Sequence, min_jobs: int = 1,
+                workers: Optional[int] = None, chunksize: int = 1) -> Iterator[Any]:
+    """
+    Yields fn(*args) for each set of arguments taken from the sequences, in
+    order and as soon as each result is ready, like the built-in map().
+
+    The calls are spread over worker processes only when there are at
+    least min_jobs of them and more than one worker; for less work,
+    starting the workers costs more than the calls they would take over.
+    Inside a worker of another process_map() call, they are always made
+    in-process.
+    When worker processes cannot be started at all (e.g. in a sandbox
+    without /dev/shm), the calls are made in this process instead. An
+    exception raised by fn itself propagates, wherever it ran.
+
+    Args:
+        fn (Callable): The function to call; it and its arguments must be
+                       picklable.
+        *sequences (Sequence): One sequence per argument of fn, all of the
+                               same length.
+        min_jobs (int): The fewest calls worth starting worker processes for.
+        workers (Optional[int]): The number of worker processes; defaults
+                                 to available_workers().
+        chunksize (int): The number of calls sent to a worker at a time.
+
+    Returns:
+        Iterator[Any]: The result of each call, in order.
+    """
+    count = len(sequences[0])
+    if workers is None:
+        workers = available_workers()
+
+    if workers > 1 and count >= min_jobs and not _IN_WORKER:
+        executor = None
+        try:
+            # Every call is submitted here, which starts the workers, so a
+            # failure to start them is raised now; failures of the calls
+            # are only raised as their results are collected below
+            executor = ProcessPoolExecutor(max_workers=min(workers, count), initializer=_mark_worker)
+            results = executor.map(fn, *sequences, chunksize=chunksize)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        else:
+            with executor:
+                yield from results
+            return
+
+    for args in zip(*sequences):
+        yield fn(*args)
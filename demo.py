@@ -12,6 +12,9 @@ import os
 import sys
 from datetime import datetime
 
+from core.orchestrator import convert_many
+from plugins.handler_factory import get_handler_or_none
+
 def create_sample_data():
     """Create sample data files for demonstration."""
     print("📁 Creating sample data files...")
@@ -30,35 +33,65 @@ Eva Williams,33,Berlin,Sales"""
     print("✅ Created sample_data.csv with employee information")
     return 'sample_data.csv'
 
+def unsupported_format(input_file, output_file):
+    """Return the first extension of the pair that has no usable handler, if any."""
+    for path in (input_file, output_file):
+        ext = os.path.splitext(path)[1]
+        if get_handler_or_none(ext.lstrip('.')) is None:
+            return ext
+    return None
+
+def run_batch(cases):
+    """
+    Run the supported (input, output, description) cases as one batch with
+    convert_many, the API behind fconv-batch. Unsupported ones are skipped
+    up front. Yields each run case with None on success or its error message.
+    """
+    runnable = []
+    for input_file, output_file, description in cases:
+        ext = unsupported_format(input_file, output_file)
+        if ext:
+            print(f"⏭️  {description}: skipped up front, no handler for '{ext}'\n")
+        else:
+            runnable.append((input_file, output_file, description))
+    
+    jobs = [(input_file, output_file) for input_file, output_file, _ in runnable]
+    yield from zip(runnable, convert_many(jobs))
+
 def demonstrate_conversions():
     """Demonstrate various file format conversions."""
     print("\n🔄 Demonstrating file format conversions...\n")
     
     sample_file = create_sample_data()
     
-    conversions = [
-        (sample_file, 'employees.json', 'CSV to JSON'),
-        ('employees.json', 'employees.pdf', 'JSON to PDF'),
-        ('employees.json', 'employees.docx', 'JSON to Word Document'),
-        ('employees.json', 'employees.pptx', 'JSON to PowerPoint'),
-        ('employees.json', 'employees.ppsx', 'JSON to PowerPoint Show'),
+    # The JSON file feeds every later conversion, so it is made first
+    batches = [
+        [(sample_file, 'employees.json', 'CSV to JSON')],
+        [
+            ('employees.json', 'employees.pdf', 'JSON to PDF'),
+            ('employees.json', 'employees.docx', 'JSON to Word Document'),
+            ('employees.json', 'employees.pptx', 'JSON to PowerPoint'),
+            ('employees.json', 'employees.ppsx', 'JSON to PowerPoint Show'),
+        ],
     ]
     
-    for input_file, output_file, description in conversions:
-        print(f"🔧 {description}...")
-        cmd = f'fconv {input_file} {output_file}'
-        print(f"   Command: {cmd}")
-        
-        result = os.system(cmd)
-        if result == 0:
-            if os.path.exists(output_file):
-                size = os.path.getsize(output_file)
-                print(f"   ✅ Success! Created {output_file} ({size} bytes)")
-            else:
-                print(f"   ⚠️  Command succeeded but file not found")
+    for conversions in batches:
+        for (input_file, output_file, description), error in run_batch(conversions):
+            print(f"🔧 {description}...")
+            print(f"   {input_file} -> {output_file}")
+            report_conversion(output_file, error)
+
+def report_conversion(output_file, error):
+    """Print the outcome of one conversion."""
+    if error is None:
+        if os.path.exists(output_file):
+            size = os.path.getsize(output_file)
+            print(f"   ✅ Success! Created {output_file} ({size} bytes)")
         else:
-            print(f"   ❌ Failed (exit code: {result})")
-        print()
+            print("   ⚠️  Conversion succeeded but file not found")
+    else:
+        print(f"   ❌ Failed: {error}")
+    print()
 
 def test_error_handling():
     """Test error handling for unsupported formats and edge cases."""
@@ -71,16 +104,14 @@ def test_error_handling():
         ('sample_data.csv', 'output.azw3', 'Complex format (AZW3)'),
     ]
     
-    for input_file, output_file, description in test_cases:
+    for (input_file, output_file, description), error in run_batch(test_cases):
         print(f"🧪 Testing: {description}")
-        cmd = f'fconv {input_file} {output_file}'
-        print(f"   Command: {cmd}")
+        print(f"   {input_file} -> {output_file}")
         
-        result = os.system(cmd)
-        if result == 0:
-            print(f"   ✅ Handled gracefully")
+        if error is None:
+            print("   ✅ Handled gracefully")
         else:
-            print(f"   ⚠️  Error handled (exit code: {result})")
+            print(f"   ⚠️  Error handled: {error}")
         print()
 
 def show_supported_formats():
@@ -141,7 +172,7 @@ def main():
         print("  • Multiple file format support")
         print("  • Intermediate format conversion")
         print("  • Error handling for unsupported formats")
-        print("  • Command-line interface (fconv)")
+        print("  • Batch API (convert_many)")
         
     except KeyboardInterrupt:
         print("\n⚠️  Demo interrupted by user")
@@ -6,26 +6,52 @@ core orchestrator to perform the file conversion.
 """
 
 import argparse
+import logging
 import sys
-import os
 
+# Running 'python main.py' puts this directory on sys.path, and the installed
+# 'fconv' entry point resolves the packages normally, so absolute imports
+# from the project root work without touching sys.path.
+from core.orchestrator import convert_file, convert_many
+from core.exceptions import ConverterError
 
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.dirname(project_root))
+
+def _build_parser(description: str, epilog: str) -> argparse.ArgumentParser:
+    """
+    Creates the argument parser shared by the fconv and fconv-batch
+    commands, including the options common to both.
+    """
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog=epilog
+    )
+
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print progress details for each conversion step."
+    )
+
+    return parser
+
+
+def _configure_logging(verbose: bool):
+    """
+    Sends the orchestrator's progress messages to stderr when verbose
+    output is requested; otherwise they are not emitted at all.
+    """
+    if verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 
-# Now that the path is set, we can use absolute imports from the project root.
-from core.orchestrator import convert_file
-from core.exceptions import ConverterError, UnsupportedFormatError
-# No additional code needed at this placeholder.
 def main():
     """
     Main function to parse arguments and trigger the conversion.
     """
-    parser = argparse.ArgumentParser(
-        description="A versatile file converter.",
-        formatter_class=argparse.RawTextHelpFormatter,
-        epilog="""
+    parser = _build_parser(
+        "A versatile file converter.",
+        """
 Examples:
   python path/to/main.py input.csv output.json
 """
@@ -42,13 +68,15 @@ Examples:
     )
     
     args = parser.parse_args()
+    _configure_logging(args.verbose)
 
     try:
         # Call the core logic from the orchestrator
         convert_file(args.input_path, args.output_path)
         print(f"\nSuccess! File '{args.input_path}' was converted to '{args.output_path}'.")
 
-    except (ConverterError, UnsupportedFormatError) as e:
+    except ConverterError as e:
+        # Unsupported formats are reported as a ConversionError
         print(f"\n[ERROR] Conversion failed: {e}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError:
@@ -59,5 +87,74 @@ Examples:
         sys.exit(1)
 
 
+def main_batch():
+    """
+    Runs every conversion listed in a manifest file in a single process,
+    so interpreter startup and plugin imports are paid only once. With
+    --jobs, the conversions are spread over that many worker processes.
+
+    The manifest holds one conversion per line as 'input<TAB>output'.
+    Blank lines and lines starting with '#' are ignored.
+    """
+    parser = _build_parser(
+        "Run many file conversions in one process.",
+        """
+Examples:
+  fconv-batch --manifest conversions.tsv
+  fconv-batch --manifest conversions.tsv --jobs 4
+"""
+    )
+
+    parser.add_argument(
+        "--manifest",
+        required=True,
+        help="Path to a tab-separated file of 'input<TAB>output' pairs."
+    )
+
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of conversions to run in parallel, in worker processes;\n0 uses every CPU. Defaults to 1."
+    )
+
+    args = parser.parse_args()
+    _configure_logging(args.verbose)
+
+    try:
+        with open(args.manifest, mode='r', encoding='utf-8') as manifest:
+            jobs = []
+            for line_num, line in enumerate(manifest, 1):
+                line = line.rstrip('\r\n')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = line.split('\t')
+                if len(fields) != 2:
+                    print(f"[ERROR] Manifest line {line_num} is not 'input<TAB>output'", file=sys.stderr)
+                    sys.exit(1)
+                jobs.append((fields[0], fields[1]))
+    except OSError as e:
+        print(f"[ERROR] Could not read manifest '{args.manifest}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.jobs < 0:
+        print("[ERROR] --jobs cannot be negative", file=sys.stderr)
+        sys.exit(1)
+
+    # Each distinct format pair is resolved once per process and reused
+    # for every job; results are reported in manifest order
+    failures = 0
+    for (input_path, output_path), error in zip(jobs, convert_many(jobs, workers=args.jobs or None)):
+        if error is None:
+            print(f"[OK] '{input_path}' -> '{output_path}'")
+        else:
+            failures += 1
+            print(f"[ERROR] '{input_path}' -> '{output_path}': {error}", file=sys.stderr)
+
+    print(f"\n{len(jobs) - failures} of {len(jobs)} conversions succeeded.")
+    if failures:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
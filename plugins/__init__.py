@@ -0,0 +1,15 @@
+"""
+File format handler plugins.
+
+HANDLERS is the registry of the bundled handlers: it maps each supported
+extension to the plugin module and class that handle it, written as
+'<module>:<class>' with the module relative to this package. The handler
+factory imports a plugin only when its extension is first requested.
+
+The registry lives in _registry.py, which scripts/gen_registry.py generates
+from the handler modules; run it after adding a bundled format.
+"""
+
+from ._registry import HANDLERS
+
+__all__ = ['HANDLERS']
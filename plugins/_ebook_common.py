@@ -0,0 +1,102 @@
+"""
+Helpers shared by the ebook handlers (AZW3 and MOBI).
+
+Both handlers convert books with Calibre's ebook-convert command and read
+them by collecting the text of each chapter document; finding and running
+the command and parsing chapters live here so they share one implementation.
+"""
+
+import os
+import sys
+import shutil
+import threading
+import subprocess
+from functools import lru_cache
+from typing import Optional
+
+# Optional: lxml parses chapter text in C; BeautifulSoup is the slower fallback
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+# lxml parsers keep reusable internal state but must not be shared between
+# threads, so each thread builds its own on first use.
+_PARSERS = threading.local()
+
+
+def _html_text(xhtml: bytes) -> str:
+    """
+    Returns the text content of an (X)HTML chapter document.
+
+    The chapter is parsed with a reused lxml HTMLParser and its text is
+    collected with itertext(), which walks the tree in C. BeautifulSoup's
+    pure-Python 'html.parser' is only used when lxml is not installed;
+    ImportError is raised if neither is.
+    """
+    if etree is None:
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(xhtml, 'html.parser').get_text().strip()
+
+    parser = getattr(_PARSERS, 'html', None)
+    if parser is None:
+        parser = _PARSERS.html = etree.HTMLParser(recover=True, huge_tree=True)
+    try:
+        root = etree.fromstring(xhtml, parser)
+    except etree.XMLSyntaxError:
+        # Raised for empty documents
+        return ''
+    if root is None:
+        return ''
+    return ''.join(root.itertext()).strip()
+
+
+# Where Calibre's installers put ebook-convert, for when it is not on PATH
+if os.name == 'nt':
+    _CALIBRE_INSTALL_PATHS = (r'C:\Program Files\Calibre2\ebook-convert.exe',)
+elif sys.platform == 'darwin':
+    _CALIBRE_INSTALL_PATHS = ('/Applications/calibre.app/Contents/MacOS/ebook-convert',)
+else:
+    _CALIBRE_INSTALL_PATHS = ()
+
+
+@lru_cache(maxsize=1)
+def _ebook_convert_cmd() -> Optional[str]:
+    """
+    Returns the path of Calibre's ebook-convert command, looked up on PATH
+    and then in Calibre's default install location for this platform, or
+    None if it is not installed. The lookup is done on first use and
+    remembered for later calls.
+    """
+    cmd = shutil.which('ebook-convert')
+    if cmd:
+        return cmd
+    for calibre_path in _CALIBRE_INSTALL_PATHS:
+        if os.path.isfile(calibre_path):
+            return calibre_path
+    return None
+
+
+def _run_ebook_convert(src: str, dst: str, timeout: int, *options: str) -> bool:
+    """
+    Converts src to dst with Calibre's ebook-convert, the formats taken from
+    the file extensions, and returns whether it succeeded. options are
+    passed on as extra command-line arguments. Returns False when Calibre
+    is not installed or the conversion times out.
+    """
+    cmd = _ebook_convert_cmd()
+    if cmd is None:
+        return False
+    try:
+        # Only the exit status is used; Calibre's progress output is
+        # discarded rather than buffered and decoded
+        result = subprocess.run(
+            [cmd, src, dst, *options],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
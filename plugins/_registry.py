@@ -0,0 +1,20 @@
+"""
+Extension -> handler registry for the bundled plugins, as
+'<module>:<class>' with the module relative to this package.
+
+Generated by scripts/gen_registry.py from the handler classes in this
+package; do not edit by hand. Run the script again after adding a handler.
+"""
+
+from typing import Dict
+
+HANDLERS: Dict[str, str] = {
+    'azw3': 'azw3_handler:Azw3Handler',
+    'csv': 'csv_handler:CsvHandler',
+    'docx': 'docx_handler:DocxHandler',
+    'json': 'json_handler:JsonHandler',
+    'mobi': 'mobi_handler:MobiHandler',
+    'pdf': 'pdf_handler:PdfHandler',
+    'ppsx': 'ppsx_handler:PpsxHandler',
+    'pptx': 'pptx_handler:PptxHandler',
+}
@@ -9,19 +9,40 @@ However, since AZW3 is proprietary and complex, this illustrates an approach.
 # Note: In real scenarios, consider using tools like Calibre command-line
 # or kindle-unpack scripts
 
-from typing import List, Dict, Any
+import os
+import shutil
+import logging
+import hashlib
+import tempfile
+import subprocess
+from typing import List, Dict, Any, Iterable, Optional
+
+log = logging.getLogger(__name__)
+
+# Optional dependency, resolved once at import: reading needs ebooklib
+try:
+    import ebooklib
+    from ebooklib import epub
+except ImportError:
+    ebooklib = epub = None
 
 # Try to import from project structure, fall back to dummy classes
 try:
     from ..core.exceptions import FileProcessingError
+    from ..core.parallel import process_map
     from .base_handler import FileHandler
+    from ._ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
 except ImportError:
     try:
         # Try absolute imports for installed package
         from core.exceptions import FileProcessingError
+        from core.parallel import process_map
         from plugins.base_handler import FileHandler
+        from plugins._ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
     except ImportError:
         # For standalone testing, we'll define dummy classes.
+        from _ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
+
         class FileProcessingError(Exception):
             def __init__(self, path, msg):
                 super().__init__(f"{msg}: {path}")
@@ -30,8 +51,219 @@ except ImportError:
             def read(self, file_path: str): pass
             def write(self, file_path: str, data): pass
 
+        def process_map(fn, *sequences, **options):
+            return map(fn, *sequences)
+
+
+def _cache_dir() -> str:
+    """
+    Returns the directory holding cached Calibre conversions. It is only
+    created once a conversion is stored in it, by _run_into_cache().
+    Honours XDG_CACHE_HOME like other desktop tools do.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'file_converter', 'azw3')
+
+
+def _file_digest(file_path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in 1 MiB chunks so
+    large books are never held in memory at once.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parts_digest(parts: Iterable[str]) -> str:
+    """
+    Returns the SHA-256 hex digest of a sequence of strings. Each part is
+    length-prefixed so that different splits of the same text differ.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode('utf-8')
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class _CalibreWorker:
+    """
+    Runs Calibre conversions, inside this process when Calibre's Python
+    modules are importable and through the ebook-convert command otherwise.
+
+    Starting ebook-convert means a fresh interpreter and plugin load for
+    every book. Loading Calibre's conversion pipeline in-process is tried
+    once; when it succeeds, every later conversion reuses it.
+    """
+
+    def __init__(self):
+        self._api = None
+        self._loaded = False
+
+    @property
+    def command(self) -> Optional[str]:
+        """
+        The path of the ebook-convert command, or None if it is not installed.
+        """
+        return _ebook_convert_cmd()
+
+    def _load_api(self):
+        """
+        Imports Calibre's Plumber on first use and remembers the outcome;
+        returns None when Calibre is only available as a command.
+        """
+        if not self._loaded:
+            try:
+                from calibre.ebooks.conversion import ConversionUserFeedBack
+                from calibre.ebooks.conversion.plumber import Plumber
+                from calibre.customize.conversion import OptionRecommendation
+                from calibre.utils.logging import Log
+                self._api = (Plumber, OptionRecommendation, Log, ConversionUserFeedBack)
+            except ImportError:
+                self._api = None
+            self._loaded = True
+        return self._api
+
+    @property
+    def available(self) -> bool:
+        """
+        Whether Calibre can be used at all, in-process or as a command.
+        """
+        return self.command is not None or self._load_api() is not None
+
+    def convert(self, source_path: str, output_path: str, timeout: int,
+                options: Dict[str, str]) -> bool:
+        """
+        Converts source_path to output_path, with formats taken from the
+        file extensions, and returns whether it succeeded. options holds
+        Calibre option names (e.g. 'title') and values. The timeout only
+        applies when ebook-convert is run as a separate process.
+
+        When an in-process conversion fails, it is retried with the
+        ebook-convert command if that is installed too.
+        """
+        api = self._load_api()
+        if api is not None:
+            Plumber, OptionRecommendation, Log, ConversionUserFeedBack = api
+            try:
+                plumber = Plumber(source_path, output_path, Log())
+                plumber.merge_ui_recommendations([
+                    (name, value, OptionRecommendation.HIGH) for name, value in options.items()
+                ])
+                plumber.run()
+                return True
+            except (ConversionUserFeedBack, ValueError, OSError):
+                # Calibre reports unreadable, DRM-protected or unsupported
+                # books with these; anything else is a bug and propagates
+                log.warning("In-process Calibre conversion of '%s' failed", source_path, exc_info=True)
+                if self.command is None:
+                    return False
+
+        flags = []
+        for name, value in options.items():
+            flags += [f"--{name}", value]
+        return _run_ebook_convert(source_path, output_path, timeout, *flags)
+
+
+# Shared by every read and write, so Calibre's Plumber is loaded at most once
+_CALIBRE = _CalibreWorker()
+
+
+def _run_into_cache(source_path: str, cache_path: str, timeout: int,
+                    options: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Converts source_path into cache_path with Calibre. Calibre writes into
+    a temporary directory, under a name that keeps the target extension.
+    Only on success is the cache directory created and the result moved
+    into place, so nothing partial is cached and a failed conversion
+    leaves no empty cache directory behind.
+    """
+    root, ext = os.path.splitext(cache_path)
+    staged_path = f"{root}.{os.getpid()}.partial{ext}"
+    with tempfile.TemporaryDirectory() as work_dir:
+        converted_path = os.path.join(work_dir, 'converted' + ext)
+        if not _CALIBRE.convert(source_path, converted_path, timeout, options or {}):
+            return False
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        try:
+            # The temporary directory may be on another file system, so the
+            # result is first moved next to its final name, then renamed
+            # over it in one step
+            shutil.move(converted_path, staged_path)
+            os.replace(staged_path, cache_path)
+        finally:
+            if os.path.exists(staged_path):
+                os.unlink(staged_path)
+    return True
+
+
+# Escaping is specialized to where the text ends up. Element content only
+# needs &, < and >; quotes are escaped as well for text placed in the
+# <title> header. Each is a single str.translate pass over the text.
+_TEXT_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+})
+
+_ATTR_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+
+def _chapter_body(title: str, paragraphs: List[str]) -> str:
+    """
+    Returns the <body> markup for one chapter: the title as a
+    heading, followed by each paragraph in its own <p>, all escaped. The
+    pieces are collected in a list and joined once rather than
+    concatenated one by one.
+    """
+    parts = ['<h1>', title.translate(_TEXT_ESCAPE), '</h1>']
+    parts.extend(f'<p>{para.translate(_TEXT_ESCAPE)}</p>' for para in paragraphs)
+    return ''.join(parts)
+
+
+def _cached_epub(file_path: str) -> Optional[str]:
+    """
+    Returns the path of the cached EPUB conversion of an AZW3 file,
+    converting it with Calibre first if needed. Returns None when there is
+    no conversion and Calibre is missing or fails.
+
+    Without Calibre, only an earlier conversion could be read, and there
+    is none if the cache directory does not exist; the input is not hashed
+    at all then.
+    """
+    cache_dir = _cache_dir()
+    if not _CALIBRE.available and not os.path.isdir(cache_dir):
+        return None
+    epub_path = os.path.join(cache_dir, f"{_file_digest(file_path)}.epub")
+    if os.path.exists(epub_path) or (
+        _CALIBRE.available and _run_into_cache(file_path, epub_path, timeout=30)
+    ):
+        return epub_path
+    return None
 
 
+# The fewest chapters worth spreading over worker processes.
+PARALLEL_MIN_CHAPTERS = 8
+
+
+def _extract_chapter_texts(documents: List[bytes]) -> List[str]:
+    """
+    Returns the text of each chapter document, in the order given.
+
+    Chapters parse independently, so larger books are spread over worker
+    processes to use every core; results come back in input order.
+    """
+    return list(process_map(_html_text, documents, min_jobs=PARALLEL_MIN_CHAPTERS, chunksize=4))
+
 
 class Azw3Handler(FileHandler):
     """
@@ -46,7 +278,8 @@ class Azw3Handler(FileHandler):
         
         This method attempts to convert AZW3 to EPUB using Calibre and then
         extracts the content. If Calibre is not available, it provides basic
-        file information.
+        file information. Converted EPUBs are cached by the SHA-256 of the
+        input file, so reading the same book again does not rerun Calibre.
 
         Args:
             file_path (str): The path to the input AZW3 file.
@@ -58,56 +291,34 @@ class Azw3Handler(FileHandler):
             FileProcessingError: If the file cannot be read or processed.
         """
         try:
-            import tempfile
-            import subprocess
-            import re
-            
             # First try to convert AZW3 to EPUB using ebook-convert if available
             # This requires Calibre to be installed on the system
             try:
-                import ebooklib
-                from ebooklib import epub
-                from bs4 import BeautifulSoup
-                
-                with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_epub:
-                    temp_epub_path = tmp_epub.name
-                
-                # Try using ebook-convert command from Calibre
-                ebook_convert_cmd = 'ebook-convert'
-                # Check if Calibre is installed in the typical Windows location
-                import os
-                calibre_path = r'C:\Program Files\Calibre2\ebook-convert.exe'
-                if os.path.exists(calibre_path):
-                    ebook_convert_cmd = calibre_path
-                
-                result = subprocess.run(
-                    [ebook_convert_cmd, file_path, temp_epub_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    # Successfully converted, now read the EPUB
-                    book = epub.read_epub(temp_epub_path)
-                    content_data = []
+                if epub is not None:
+                    # Conversions are cached by the input's content hash, so a
+                    # book that was already converted skips Calibre entirely
+                    epub_path = _cached_epub(file_path)
+                    if epub_path is not None:
+                        # Successfully converted, now read the EPUB
+                        book = epub.read_epub(epub_path)
+                        content_data = []
                     
-                    # Extract metadata
-                    title = book.get_metadata('DC', 'title')
-                    author = book.get_metadata('DC', 'creator')
+                        # Extract metadata
+                        title = book.get_metadata('DC', 'title')
+                        author = book.get_metadata('DC', 'creator')
                     
-                    content_data.append({
-                        'type': 'metadata',
-                        'title': title[0][0] if title else 'Unknown',
-                        'author': author[0][0] if author else 'Unknown',
-                        'content': f"Title: {title[0][0] if title else 'Unknown'}\nAuthor: {author[0][0] if author else 'Unknown'}"
-                    })
+                        content_data.append({
+                            'type': 'metadata',
+                            'title': title[0][0] if title else 'Unknown',
+                            'author': author[0][0] if author else 'Unknown',
+                            'content': f"Title: {title[0][0] if title else 'Unknown'}\nAuthor: {author[0][0] if author else 'Unknown'}"
+                        })
                     
-                    # Extract text content from chapters
-                    for item in book.get_items():
-                        if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                            soup = BeautifulSoup(item.get_content(), 'html.parser')
-                            text = soup.get_text().strip()
+                        # Extract text content from chapters
+                        chapters = [item for item in book.get_items()
+                                    if item.get_type() == ebooklib.ITEM_DOCUMENT]
+                        texts = _extract_chapter_texts([item.get_content() for item in chapters])
+                        for item, text in zip(chapters, texts):
                             if text:
                                 content_data.append({
                                     'type': 'chapter',
@@ -115,24 +326,16 @@ class Azw3Handler(FileHandler):
                                     'content': text
                                 })
                     
-                    # Clean up temp file
-                    import os
-                    try:
-                        os.unlink(temp_epub_path)
-                    except:
-                        pass
-                    
-                    return content_data if content_data else [{
-                        'type': 'text',
-                        'content': 'No readable content found in AZW3 file'
-                    }]
+                        return content_data if content_data else [{
+                            'type': 'text',
+                            'content': 'No readable content found in AZW3 file'
+                        }]
                 
             except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, ImportError):
                 # Calibre or required libraries not available, fall back to basic file reading
                 pass
             
             # Fallback: provide basic file information
-            import os
             if os.path.exists(file_path):
                 file_size = os.path.getsize(file_path)
                 return [{
@@ -144,6 +347,9 @@ class Azw3Handler(FileHandler):
             else:
                 raise FileProcessingError(file_path, "AZW3 file not found")
             
+        except FileProcessingError:
+            # Already describes the failure; don't wrap it in a second error
+            raise
         except FileNotFoundError:
             raise FileProcessingError(file_path, "AZW3 file not found")
         except Exception as e:
@@ -153,8 +359,11 @@ class Azw3Handler(FileHandler):
         """
         Creates an AZW3 file from the provided data.
         
-        This method creates an EPUB first and then converts it to AZW3 using Calibre.
-        If Calibre is not available, it will create an HTML file instead.
+        This method builds a single HTML document and converts it to AZW3
+        using Calibre, which picks up each chapter from its heading. If
+        Calibre is not available, it will save the HTML file instead.
+        Converted books are cached, so writing the same content again copies
+        the earlier result instead of rerunning Calibre.
 
         Args:
             file_path (str): The path to the output AZW3 file.
@@ -168,15 +377,6 @@ class Azw3Handler(FileHandler):
             raise ValueError("Input data for AZW3 writing cannot be empty.")
         
         try:
-            import ebooklib
-            from ebooklib import epub
-            import tempfile
-            import subprocess
-            import html
-            
-            # Create an EPUB first
-            book = epub.EpubBook()
-            
             # Set metadata
             title = "Converted Document"
             author = "File Converter"
@@ -188,13 +388,8 @@ class Azw3Handler(FileHandler):
                     author = item.get('author', author)
                     break
             
-            book.set_identifier('converted_doc')
-            book.set_title(title)
-            book.set_language('en')
-            book.add_author(author)
-            
             # Create chapters from content
-            chapters = []
+            chapter_bodies = []
             chapter_num = 1
             
             for item in data:
@@ -215,129 +410,81 @@ class Azw3Handler(FileHandler):
                         content = str(item)
                     
                     if content and content.strip():
-                        # Create HTML content
-                        html_content = f'<html><head><title>{html.escape(chapter_title)}</title></head><body>'
-                        html_content += f'<h1>{html.escape(chapter_title)}</h1>'
-                        
-                        # Convert content to HTML paragraphs
-                        paragraphs = content.split('\n')
-                        for para in paragraphs:
-                            if para.strip():
-                                html_content += f'<p>{html.escape(para.strip())}</p>'
-                        
-                        html_content += '</body></html>'
-                        
-                        # Create chapter
-                        chapter = epub.EpubHtml(
-                            title=chapter_title,
-                            file_name=f'chapter_{chapter_num}.xhtml',
-                            lang='en'
-                        )
-                        chapter.content = html_content
-                        
-                        book.add_item(chapter)
-                        chapters.append(chapter)
+                        # Create HTML content, one paragraph per line
+                        chapter_bodies.append(_chapter_body(
+                            chapter_title,
+                            [para for para in map(str.strip, content.split('\n')) if para]
+                        ))
                         chapter_num += 1
                 
                 else:
                     # Handle non-dict items
                     content = str(item)
                     if content.strip():
-                        chapter_title = f'Chapter {chapter_num}'
-                        html_content = f'<html><head><title>{html.escape(chapter_title)}</title></head><body>'
-                        html_content += f'<h1>{html.escape(chapter_title)}</h1>'
-                        html_content += f'<p>{html.escape(content)}</p>'
-                        html_content += '</body></html>'
-                        
-                        chapter = epub.EpubHtml(
-                            title=chapter_title,
-                            file_name=f'chapter_{chapter_num}.xhtml',
-                            lang='en'
-                        )
-                        chapter.content = html_content
-                        
-                        book.add_item(chapter)
-                        chapters.append(chapter)
+                        chapter_bodies.append(_chapter_body(f'Chapter {chapter_num}', [content]))
                         chapter_num += 1
             
             # If no chapters were created, create a default one
-            if not chapters:
-                default_content = '<html><head><title>Document</title></head><body><h1>Document</h1><p>No content available</p></body></html>'
-                chapter = epub.EpubHtml(title='Document', file_name='chapter_1.xhtml', lang='en')
-                chapter.content = default_content
-                book.add_item(chapter)
-                chapters.append(chapter)
+            if not chapter_bodies:
+                chapter_bodies.append(_chapter_body('Document', ['No content available']))
             
-            # Define table of contents and spine
-            book.toc = chapters
-            book.add_item(epub.EpubNcx())
-            book.add_item(epub.EpubNav())
-            book.spine = ['nav'] + chapters
+            # Create a single HTML file with all content
+            parts = [
+                '<html><head><title>', title.translate(_ATTR_ESCAPE), '</title></head><body>',
+                '<h1>', title.translate(_TEXT_ESCAPE), '</h1>',
+                '<p><em>Author: ', author.translate(_TEXT_ESCAPE), '</em></p>',
+            ]
+            parts.extend(chapter_bodies)
+            parts.append('</body></html>')
+            document = ''.join(parts)
             
-            # First try to create AZW3 directly using Calibre
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_epub:
-                    temp_epub_path = tmp_epub.name
-                
-                # Write EPUB to temp file
-                epub.write_epub(temp_epub_path, book)
-                
-                # Convert EPUB to AZW3 using ebook-convert
-                ebook_convert_cmd = 'ebook-convert'
-                # Check if Calibre is installed in the typical Windows location
-                import os
-                calibre_path = r'C:\Program Files\Calibre2\ebook-convert.exe'
-                if os.path.exists(calibre_path):
-                    ebook_convert_cmd = calibre_path
-                
-                result = subprocess.run(
-                    [ebook_convert_cmd, temp_epub_path, file_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+            # First try to create AZW3 directly using Calibre, which reads
+            # the HTML as it is; no intermediate EPUB is assembled. Results
+            # are cached under a hash of the document and its metadata.
+            azw3_path = os.path.join(_cache_dir(), _parts_digest([title, author, document]) + '.azw3')
+            if os.path.exists(azw3_path):
+                shutil.copyfile(azw3_path, file_path)
+                return  # Success!
+
+            # When Calibre is missing, skip straight to the HTML fallback
+            # without writing the temporary input file
+            if _CALIBRE.available:
+                with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', suffix='.html', delete=False) as tmp_html:
+                    tmp_html.write(document)
+                    temp_html_path = tmp_html.name
                 
-                # Clean up temp file
-                import os
                 try:
-                    os.unlink(temp_epub_path)
-                except:
-                    pass
+                    # Convert HTML to AZW3 using Calibre
+                    converted = _run_into_cache(
+                        temp_html_path, azw3_path, timeout=60,
+                        options={'title': title, 'authors': author}
+                    )
+                except FileNotFoundError:
+                    converted = False
+                finally:
+                    # Clean up temp file
+                    try:
+                        os.unlink(temp_html_path)
+                    except OSError:
+                        pass
                 
-                if result.returncode == 0:
+                if converted:
+                    shutil.copyfile(azw3_path, file_path)
                     return  # Success!
-                else:
-                    raise subprocess.CalledProcessError(result.returncode, 'ebook-convert')
             
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                # Calibre not available, create an HTML file instead
-                html_file_path = file_path.replace('.azw3', '.html')
-                
-                # Create a single HTML file with all content
-                html_content = f'<html><head><title>{html.escape(title)}</title></head><body>'
-                html_content += f'<h1>{html.escape(title)}</h1>'
-                html_content += f'<p><em>Author: {html.escape(author)}</em></p>'
-                
-                for chapter in chapters:
-                    # Extract content from each chapter
-                    chapter_content = chapter.content
-                    if '<body>' in chapter_content:
-                        body_start = chapter_content.find('<body>') + 6
-                        body_end = chapter_content.find('</body>')
-                        if body_end > body_start:
-                            html_content += chapter_content[body_start:body_end]
-                
-                html_content += '</body></html>'
-                
-                with open(html_file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                raise FileProcessingError(
-                    file_path,
-                    f"Calibre not found. Created HTML file instead: {html_file_path}. Install Calibre for AZW3 support."
-                )
+            # Calibre not available, create an HTML file instead
+            html_file_path = file_path.replace('.azw3', '.html')
+            
+            with open(html_file_path, 'w', encoding='utf-8') as f:
+                f.write(document)
+            
+            raise FileProcessingError(
+                file_path,
+                f"Calibre not found. Created HTML file instead: {html_file_path}. Install Calibre for AZW3 support."
+            )
             
-        except ValueError as e:
-            raise e
+        except (ValueError, FileProcessingError):
+            # Already describes the failure; don't wrap it in a second error
+            raise
         except Exception as e:
             raise FileProcessingError(file_path, f"An error occurred while writing the AZW3 file: {e}")
@@ -6,7 +6,9 @@ abstract methods, ensuring a consistent interface for the core engine.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from itertools import chain
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple, Type
+
 
 class FileHandler(ABC):
     """
@@ -14,6 +16,10 @@ class FileHandler(ABC):
 
     This class defines the standard interface for reading from and writing to
     a specific file format. It also specifies which conversions are supported.
+
+    The handler factory shares one instance per handler class across
+    conversions, including conversions running in different threads, so
+    handlers must not keep per-file state on the instance.
     """
 
     @abstractmethod
@@ -47,6 +53,63 @@ class FileHandler(ABC):
         """
         pass
 
+    def iter_read(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Reads a file and yields its content one intermediate-format record
+        at a time.
+
+        The default implementation iterates over the list returned by
+        read(). Handlers that can parse their format incrementally should
+        override this so callers never hold the whole file in memory.
+
+        Args:
+            file_path (str): The path to the input file.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The file content, record by record.
+
+        Raises:
+            FileProcessingError: If the file cannot be read or parsed.
+        """
+        return iter(self.read(file_path))
+
+    def write_stream(self, file_path: str, data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Writes records from any iterable of the intermediate format, such
+        as the iterator returned by another handler's iter_read().
+
+        The default implementation collects the records into a list and
+        calls write(). Handlers that can encode their format incrementally
+        should override this to consume the iterable lazily.
+
+        Args:
+            file_path (str): The path to the output file.
+            data (Iterable[Dict[str, Any]]): The records to write.
+
+        Raises:
+            FileProcessingError: If the file cannot be written.
+        """
+        self.write(file_path, list(data))
+
+    def write_batches(self, file_path: str, batches: Iterable[List[Dict[str, Any]]]) -> None:
+        """
+        Writes records delivered in batches (lists of records), as produced
+        by the orchestrator for inputs larger than a single batch.
+
+        The default implementation flattens the batches and calls
+        write_stream(). Handlers that can encode many records per call
+        should override this to work on a whole batch at a time.
+
+        Args:
+            file_path (str): The path to the output file.
+            batches (Iterable[List[Dict[str, Any]]]): The records to write,
+                                                      grouped into lists.
+
+        Raises:
+            FileProcessingError: If the file cannot be written.
+        """
+        self.write_stream(file_path, chain.from_iterable(batches))
+
     @classmethod
     def get_supported_conversions(cls) -> List[Tuple[str, str]]:
         """
@@ -64,3 +127,32 @@ class FileHandler(ABC):
         # Default implementation can be empty, requiring subclasses to be specific.
         return []
 
+
+
+# Handler classes registered with register_handler(), keyed by lowercase
+# extension. The handler factory looks formats up here before it falls back
+# to inspecting plugin modules for FileHandler subclasses.
+_REGISTERED: Dict[str, Type[FileHandler]] = {}
+
+
+def register_handler(ext: str) -> Callable[[Type[FileHandler]], Type[FileHandler]]:
+    """
+    Class decorator that registers a handler for a file extension when its
+    module is imported, so the factory does not have to infer the format
+    from class names.
+
+    Example:
+        @register_handler('xml')
+        class XmlHandler(FileHandler):
+            ...
+
+    Args:
+        ext (str): The file extension handled, without the leading dot.
+
+    Returns:
+        Callable: The decorator, which returns the class unchanged.
+    """
+    def decorator(cls: Type[FileHandler]) -> Type[FileHandler]:
+        _REGISTERED[ext.lower()] = cls
+        return cls
+    return decorator
@@ -6,7 +6,11 @@ and writing of data in Comma-Separated Values format.
 """
 
 import csv
-from typing import List, Dict, Any
+import sys
+import threading
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 # Try to import from project structure, fall back to dummy classes
 try:
@@ -27,6 +31,150 @@ except ImportError:
             def read(self, file_path: str) -> List[Dict[str, Any]]: pass
             def write(self, file_path: str, data: List[Dict[str, Any]]): pass
 
+# PyArrow's multithreaded C++ parser is used for reading when it is
+# installed; the csv module handles everything else.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+def _max_field_size() -> int:
+    """
+    Returns the largest field size limit the csv module accepts here.
+    sys.maxsize overflows a C long on some platforms, where the largest
+    32-bit value is used instead. The current limit is left unchanged.
+    """
+    previous = csv.field_size_limit()
+    try:
+        csv.field_size_limit(sys.maxsize)
+        return sys.maxsize
+    except OverflowError:
+        return 2**31 - 1
+    finally:
+        csv.field_size_limit(previous)
+
+
+_MAX_FIELD_SIZE = _max_field_size()
+
+# Rows parsed at a time while the field size limit is lifted.
+_PARSE_BATCH_SIZE = 1024
+
+# The number of threads inside _unlimited_fields(), and the limit to put
+# back once the last of them leaves. Both are guarded by _LIMIT_LOCK.
+_LIMIT_LOCK = threading.Lock()
+_limit_users = 0
+_saved_limit = None
+
+
+@contextmanager
+def _unlimited_fields():
+    """
+    Lets the csv module parse fields of any size, as PyArrow does, instead
+    of rejecting those over its 128 KiB default.
+
+    The limit is shared by every thread in the process, and handler
+    instances are shared between threads too. The first thread in lifts
+    the limit and the last one out restores it, so no reader puts the
+    default back while another is still parsing.
+    """
+    global _limit_users, _saved_limit
+    with _LIMIT_LOCK:
+        if _limit_users == 0:
+            _saved_limit = csv.field_size_limit(_MAX_FIELD_SIZE)
+        _limit_users += 1
+    try:
+        yield
+    finally:
+        with _LIMIT_LOCK:
+            _limit_users -= 1
+            if _limit_users == 0:
+                csv.field_size_limit(_saved_limit)
+
+
+def _read_header(csvfile) -> Optional[List[str]]:
+    """
+    Returns the first row of an open CSV file, or None if it is empty.
+    """
+    with _unlimited_fields():
+        return next(csv.reader(csvfile), None)
+
+
+def _reader_rows(reader) -> Iterator[List[str]]:
+    """
+    Yields the rows of a csv.reader, parsing them _PARSE_BATCH_SIZE at a
+    time with the field size limit lifted. Between batches, and so while
+    the rows are being consumed, the caller's limit is in place.
+    """
+    while True:
+        with _unlimited_fields():
+            rows = list(islice(reader, _PARSE_BATCH_SIZE))
+        if not rows:
+            return
+        yield from rows
+
+
+def _arrow_options(fieldnames: List[str]) -> Dict[str, Any]:
+    """
+    Returns the PyArrow CSV options that make it read a file as the csv
+    module does, so the intermediate data does not depend on which parser
+    is available.
+
+    The column names are the header row as csv.reader split it, rather
+    than Arrow's own reading of it; Arrow drops a UTF-8 byte order mark
+    that the csv module keeps in the first name, for one. Every column is
+    read as a string, matching csv.DictReader.
+    """
+    return {
+        'read_options': pacsv.ReadOptions(column_names=fieldnames, skip_rows=1),
+        'parse_options': pacsv.ParseOptions(newlines_in_values=True),
+        'convert_options': pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in fieldnames}
+        ),
+    }
+
+
+def _arrow_rows(file_path: str, fieldnames: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parses a CSV file with PyArrow and yields its rows as dictionaries.
+    """
+    reader = pacsv.open_csv(file_path, **_arrow_options(fieldnames))
+    for batch in reader:
+        yield from batch.to_pylist()
+
+
+def _dict_rows(csvfile) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the rows of an open CSV file as dictionaries keyed by the first
+    row, exactly as csv.DictReader would.
+
+    DictReader handles every row in Python. Here a row of the expected width,
+    by far the common case, costs a single dict(zip(...)) call; only short
+    and long rows take the slower path that fills in the same padding
+    (None) and overflow (a list under the None key) that DictReader does.
+    """
+    rows = _reader_rows(csv.reader(csvfile))
+    headers = next(rows, None)
+    if headers is None:
+        return
+
+    width = len(headers)
+    for row in rows:
+        if not row:
+            # DictReader skips blank lines, also when the header is empty
+            continue
+        if len(row) == width:
+            yield dict(zip(headers, row))
+        else:
+            record = dict(zip(headers, row))
+            if len(row) < width:
+                for name in headers[len(row):]:
+                    record[name] = None
+            else:
+                record[None] = row[width:]
+            yield record
+
 
 class CsvHandler(FileHandler):
     """
@@ -45,14 +193,45 @@ class CsvHandler(FileHandler):
         Returns:
             List[Dict[str, Any]]: A list where each dictionary represents a row.
 
+        Raises:
+            FileProcessingError: If the file cannot be found, read, or is malformed.
+        """
+        return list(self.iter_read(file_path))
+
+    def iter_read(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Reads a CSV file lazily, yielding one dictionary per row. The file
+        stays open until the rows are exhausted or the iterator is closed.
+
+        Rows are parsed with PyArrow when it is installed. Input it rejects,
+        such as rows with a different number of fields than the header, is
+        handed to the csv module from the first row PyArrow did not yield.
+
+        Args:
+            file_path (str): The path to the input CSV file.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The rows of the file, in order.
+
         Raises:
             FileProcessingError: If the file cannot be found, read, or is malformed.
         """
         try:
             with open(file_path, mode='r', encoding='utf-8', newline='') as csvfile:
-                # DictReader uses the first row as keys, which is what we want.
-                reader = csv.DictReader(csvfile)
-                return list(reader)
+                yielded = 0
+                if pa is not None:
+                    fieldnames = _read_header(csvfile)
+                    if fieldnames:
+                        try:
+                            for row in _arrow_rows(file_path, fieldnames):
+                                yield row
+                                yielded += 1
+                            return
+                        except pa.ArrowException:
+                            pass
+                    csvfile.seek(0)
+
+                yield from islice(_dict_rows(csvfile), yielded, None)
         except FileNotFoundError:
             raise FileProcessingError(file_path, "CSV file not found")
         except Exception as e:
@@ -73,18 +252,69 @@ class CsvHandler(FileHandler):
         """
         if not data:
             raise ValueError("Input data for CSV writing cannot be empty.")
-        
-        # All dictionaries in the list must have the same keys to form a valid CSV.
+
+        self.write_stream(file_path, data)
+
+    def write_stream(self, file_path: str, data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Writes records to a CSV file as they are produced, without
+        collecting them into a list first.
+
+        Args:
+            file_path (str): The path to the output CSV file.
+            data (Iterable[Dict[str, Any]]): The records to be written.
+
+        Raises:
+            FileProcessingError: If the data is invalid or file cannot be written.
+            ValueError: If there are no records to write.
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            raise ValueError("Input data for CSV writing cannot be empty.")
+
+        self._write_rows(file_path, first_row, [[first_row], rows])
+
+    def write_batches(self, file_path: str, batches: Iterable[List[Dict[str, Any]]]) -> None:
+        """
+        Writes batches of records to a CSV file, encoding one whole batch
+        per writerows() call.
+
+        Args:
+            file_path (str): The path to the output CSV file.
+            batches (Iterable[List[Dict[str, Any]]]): The records to be written,
+                                                      grouped into lists.
+
+        Raises:
+            FileProcessingError: If the data is invalid or file cannot be written.
+            ValueError: If there are no records to write.
+        """
+        batches = iter(batches)
+        first_batch = next(batches, None)
+        if not first_batch:
+            raise ValueError("Input data for CSV writing cannot be empty.")
+
+        self._write_rows(file_path, first_batch[0], chain([first_batch], batches))
+
+    def _write_rows(self, file_path: str, first_row: Dict[str, Any],
+                    chunks: Iterable[Iterable[Dict[str, Any]]]) -> None:
+        """
+        Writes the header taken from first_row, then every chunk of rows.
+        """
+        # All dictionaries must have the same keys to form a valid CSV.
         # We'll use the keys from the first dictionary as the header.
-        headers = list(data[0].keys())
+        headers = list(first_row.keys())
 
         try:
             with open(file_path, mode='w', encoding='utf-8', newline='') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=headers)
                 writer.writeheader()
-                writer.writerows(data)
+                for chunk in chunks:
+                    writer.writerows(chunk)
+        except FileProcessingError:
+            # Raised by the upstream reader while it was being consumed
+            raise
         except IOError as e:
             raise FileProcessingError(file_path, f"Could not write to CSV file: {e}")
         except Exception as e:
             raise FileProcessingError(file_path, f"An unexpected error occurred during CSV writing: {e}")
-
@@ -4,8 +4,13 @@ Concrete implementation of FileHandler for Word documents (.docx).
 This module uses python-docx to read and write Word documents.
 """
 
+import re
 from docx import Document
-from typing import List, Dict, Any
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from lxml import etree
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Optional
 
 # Try to import from project structure, fall back to dummy classes
 try:
@@ -27,6 +32,125 @@ except ImportError:
             def write(self, file_path: str, data): pass
 
 
+_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+# Compiled once; python-docx's own element helpers compile an XPath
+# expression on every call, which dominates reading large tables.
+_CELL_PARAGRAPHS = etree.XPath('./w:p', namespaces=_NS)
+_PARAGRAPH_TEXT = etree.XPath(
+    '(./w:r | ./w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:br'
+    ' or self::w:cr or self::w:noBreakHyphen or self::w:ptab]',
+    namespaces=_NS
+)
+_GRID_BEFORE = etree.XPath('string(./w:trPr/w:gridBefore/@w:val)', namespaces=_NS)
+_GRID_SPAN = etree.XPath('string(./w:tcPr/w:gridSpan/@w:val)', namespaces=_NS)
+_V_MERGE = etree.XPath('./w:tcPr/w:vMerge', namespaces=_NS)
+_VAL = '{%s}val' % _NS['w']
+_TYPE = '{%s}type' % _NS['w']
+
+# The text each non-<w:t> run element stands for. Only python-docx 1.0 and
+# later give its element classes a __str__, so the text is mapped here.
+_RUN_ITEM_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+_W_T_TAG = qn('w:t')
+_W_BR_TAG = qn('w:br')
+
+
+def _run_item_text(e) -> str:
+    """
+    Returns the text of one element matched by _PARAGRAPH_TEXT. Page and
+    column breaks carry no text; other line breaks become a newline.
+    """
+    if e.tag == _W_T_TAG:
+        return e.text or ''
+    if e.tag == _W_BR_TAG:
+        return '\n' if e.get(_TYPE, 'textWrapping') == 'textWrapping' else ''
+    return _RUN_ITEM_TEXT.get(e.tag, '')
+
+
+def _table_rows(tbl) -> List[List[str]]:
+    """
+    Returns the stripped text of every cell in a table, row by row, read
+    straight from the table's <w:tr>/<w:tc> elements.
+
+    Merged cells come out the same way python-docx's row.cells reports
+    them: a cell spanning several grid columns is repeated once per column,
+    and a vertically merged continuation repeats the text of the cell above.
+    Rows are read in a single pass, with the text at each grid column kept
+    for the next row, instead of building cell proxies and walking back up
+    the table for every merged cell.
+    """
+    rows = []
+    above = {}
+    for tr in tbl.tr_lst:
+        row = []
+        current = {}
+        col = int(_GRID_BEFORE(tr) or 0)
+        for tc in tr.tc_lst:
+            v_merge = _V_MERGE(tc)
+            if v_merge and v_merge[0].get(_VAL, 'continue') == 'continue':
+                text = above.get(col, '')
+            else:
+                text = '\n'.join(
+                    ''.join(map(_run_item_text, _PARAGRAPH_TEXT(p))) for p in _CELL_PARAGRAPHS(tc)
+                ).strip()
+            span = int(_GRID_SPAN(tc) or 1)
+            current[col] = text
+            row.extend([text] * span)
+            col += span
+        rows.append(row)
+        above = current
+    return rows
+
+
+_W_P = qn('w:p')
+_W_PPR = qn('w:pPr')
+_W_PSTYLE = qn('w:pStyle')
+_W_R = qn('w:r')
+_W_T = qn('w:t')
+_W_TAB = qn('w:tab')
+_W_BR = qn('w:br')
+_W_VAL = qn('w:val')
+_XML_SPACE = qn('xml:space')
+
+# Tabs and line breaks become their own run elements, as in python-docx
+_RUN_SPECIAL = re.compile(r'([\t\r\n])')
+
+
+def _append_paragraph(body, sect_pr, text: str, style_id: Optional[str] = None):
+    """
+    Appends a <w:p><w:r>...</w:r></w:p> paragraph holding text to the
+    document body, just before its section properties.
+
+    This builds the same XML as doc.add_paragraph() with a style assigned,
+    but directly with lxml, skipping the Paragraph and Run proxies and the
+    style resolution python-docx does for every call.
+    """
+    p = body.makeelement(_W_P, {})
+    if style_id is not None:
+        etree.SubElement(etree.SubElement(p, _W_PPR), _W_PSTYLE).set(_W_VAL, style_id)
+    r = etree.SubElement(p, _W_R)
+    for piece in _RUN_SPECIAL.split(text):
+        if piece == '\t':
+            etree.SubElement(r, _W_TAB)
+        elif piece in ('\r', '\n'):
+            etree.SubElement(r, _W_BR)
+        elif piece:
+            t = etree.SubElement(r, _W_T)
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(_XML_SPACE, 'preserve')
+
+    if sect_pr is not None:
+        sect_pr.addprevious(p)
+    else:
+        body.append(p)
+
+
 class DocxHandler(FileHandler):
     """
     Handles reading and writing of Word documents (.docx files).
@@ -52,30 +176,40 @@ class DocxHandler(FileHandler):
             doc = Document(file_path)
             content_data = []
             
+            # Resolving paragraph.style looks the style up in the styles
+            # part every time. Documents reuse a handful of styles, so each
+            # style id (taken straight from the paragraph's XML) is resolved
+            # to its name only once.
+            style_names = {}
+
             # Extract paragraphs
             for para_num, paragraph in enumerate(doc.paragraphs, 1):
-                if paragraph.text.strip():  # Only include non-empty paragraphs
-                    content_data.append({
-                        'type': 'paragraph',
-                        'number': para_num,
-                        'content': paragraph.text.strip(),
-                        'style': paragraph.style.name if paragraph.style else 'Normal'
-                    })
+                # Paragraph.text joins every run, so it is read and stripped once
+                text = paragraph.text.strip()
+                if not text:  # Only include non-empty paragraphs
+                    continue
+
+                style_id = paragraph._p.style
+                if style_id not in style_names:
+                    style = paragraph.style
+                    style_names[style_id] = style.name if style else 'Normal'
+
+                content_data.append({
+                    'type': 'paragraph',
+                    'number': para_num,
+                    'content': text,
+                    'style': style_names[style_id]
+                })
             
             # Extract tables
             for table_num, table in enumerate(doc.tables, 1):
-                table_data = []
-                for row_num, row in enumerate(table.rows):
-                    row_data = []
-                    for cell in row.cells:
-                        row_data.append(cell.text.strip())
-                    table_data.append(row_data)
+                table_data = _table_rows(table._tbl)
                 
                 content_data.append({
                     'type': 'table',
                     'number': table_num,
                     'content': table_data,
-                    'rows': len(table.rows),
+                    'rows': len(table_data),
                     'columns': len(table.columns)
                 })
             
@@ -100,53 +234,93 @@ class DocxHandler(FileHandler):
         """
         if not data:
             raise ValueError("Input data for Word document writing cannot be empty.")
-        
+
+        self.write_stream(file_path, data)
+
+    def write_stream(self, file_path: str, data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Writes records to a Word document as they are produced, without
+        collecting them into a list first.
+
+        Args:
+            file_path (str): The path to the output Word document.
+            data (Iterable[Dict[str, Any]]): The records to be written.
+
+        Raises:
+            FileProcessingError: If the file cannot be written.
+            ValueError: If there are no records to write.
+        """
+        items = iter(data)
+        first_item = next(items, None)
+        if first_item is None:
+            raise ValueError("Input data for Word document writing cannot be empty.")
+
         try:
             doc = Document()
+
+            # Looking a style up by name scans the document's styles, so the
+            # paragraph styles it defines are collected once, by name. The
+            # default style is applied by leaving the style out.
+            default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+            paragraph_styles = {
+                style.name: (None if style == default_style else style.style_id)
+                for style in doc.styles
+                if style.type == WD_STYLE_TYPE.PARAGRAPH
+            }
+
+            # Paragraphs are appended as raw XML, before the section
+            # properties that must stay last in the body
+            body = doc.element.body
+            sect_pr = body.sectPr
             
-            for item in data:
+            for item in chain([first_item], items):
                 if isinstance(item, dict):
                     # Handle different content types
                     if item.get('type') == 'table' and 'content' in item:
                         # Create table
                         table_data = item['content']
                         if table_data and isinstance(table_data, list):
-                            table = doc.add_table(rows=len(table_data), cols=len(table_data[0]))
+                            cols = len(table_data[0])
+                            table = doc.add_table(rows=len(table_data), cols=cols)
+                            # table.cell() rebuilds this flat, row-major list
+                            # of cells on every call; compute it once instead
+                            cells = table._cells
                             for row_idx, row_data in enumerate(table_data):
+                                base = row_idx * cols
                                 for col_idx, cell_data in enumerate(row_data):
-                                    table.cell(row_idx, col_idx).text = str(cell_data)
+                                    cells[base + col_idx].text = cell_data if type(cell_data) is str else str(cell_data)
                     
                     elif 'content' in item:
                         # Add paragraph
                         text = str(item['content'])
                         if text.strip():
-                            para = doc.add_paragraph(text)
-                            # Apply style if specified
-                            if 'style' in item:
-                                try:
-                                    para.style = item['style']
-                                except:
-                                    # If style doesn't exist, keep default
-                                    pass
+                            # Apply style if specified and the document has
+                            # it; otherwise keep the default
+                            style_name = item.get('style')
+                            style_id = paragraph_styles.get(style_name) if isinstance(style_name, str) else None
+                            _append_paragraph(body, sect_pr, text, style_id)
                     
                     elif 'text' in item:
                         text = str(item['text'])
                         if text.strip():
-                            doc.add_paragraph(text)
+                            _append_paragraph(body, sect_pr, text)
                     
                     else:
                         # Convert entire dict to string
                         text = str(item)
                         if text.strip():
-                            doc.add_paragraph(text)
+                            _append_paragraph(body, sect_pr, text)
                 
                 else:
                     # Handle non-dict items
                     text = str(item)
                     if text.strip():
-                        doc.add_paragraph(text)
+                        _append_paragraph(body, sect_pr, text)
             
             doc.save(file_path)
             
+        except FileProcessingError:
+            # Raised by the upstream reader while it was being consumed
+            raise
         except Exception as e:
             raise FileProcessingError(file_path, f"An error occurred while writing the Word document: {e}")
@@ -8,19 +8,23 @@ extensible by default.
 """
 
 import os
-import pkgutil
-import inspect
-from typing import Dict, Type
+import sys
+import functools
+import threading
+from importlib import import_module
+from typing import Dict, FrozenSet, Optional, Tuple
 
 # Try to import from project structure, fall back to dummy classes
 try:
     from ..core.exceptions import UnsupportedFormatError
-    from .base_handler import FileHandler
+    from .base_handler import FileHandler, _REGISTERED as _HANDLERS
+    from . import HANDLERS
 except ImportError:
     try:
         # Try absolute imports for installed package
         from core.exceptions import UnsupportedFormatError
-        from plugins.base_handler import FileHandler
+        from plugins.base_handler import FileHandler, _REGISTERED as _HANDLERS
+        from plugins import HANDLERS
     except ImportError:
         # For standalone testing, we'll define dummy classes.
         class UnsupportedFormatError(Exception):
@@ -31,48 +35,244 @@ except ImportError:
             def read(self, file_path: str): pass
             def write(self, file_path: str, data): pass
 
+        HANDLERS = {}
+        _HANDLERS = {}
+
 # ---- Handler Factory Implementation ----
 
-_HANDLERS: Dict[str, Type[FileHandler]] = {}
+# _HANDLERS is the registry filled by the register_handler() decorator, to
+# which handlers found by inspecting undecorated plugin modules are added.
+
+# Bundled handlers, keyed by extension: (module name, class name), split
+# once from the package's HANDLERS registry. These are imported only when
+# their format is first requested, so converting CSV to JSON never loads
+# reportlab, python-docx or python-pptx.
+_LAZY: Dict[str, Tuple[str, str]] = {
+    ext: tuple(target.split(':', 1)) for ext, target in HANDLERS.items()
+}
+
+# Extensions handled by the bundled plugins.
+SUPPORTED_EXTS: FrozenSet[str] = frozenset(_LAZY)
+
+# Canonical (interned) string objects for the bundled extensions. Lookups
+# map a freshly lowercased extension onto these, so the cache and registry
+# keys are shared objects rather than a new string per call. Other
+# extensions, which may come from user input, are never interned.
+_CANONICAL: Dict[str, str] = {ext: sys.intern(ext) for ext in _LAZY}
+
+# Modules that never need to be scanned for additional handlers.
+_SKIP_DISCOVERY = {module_name for module_name, _ in _LAZY.values()} | {'__init__', 'base_handler', 'handler_factory', '_registry', '_ebook_common'}
+
+# Set once the non-bundled plugin modules have all been scanned. The lock
+# makes concurrent first lookups wait for one scan instead of each running
+# their own; once the flag is set it is not taken again.
+_DISCOVERED = False
+_DISCOVERY_LOCK = threading.Lock()
+
+def _register_module_handlers(module):
+    """
+    Registers every FileHandler subclass defined in a plugin module, keyed
+    by the format inferred from its class name. Classes the module merely
+    imports, such as FileHandler itself or another plugin's handler, are
+    left to the module that defines them.
+
+    This is only needed for plugins that do not use register_handler().
+    """
+    module_name = module.__name__
+    # Walk the module namespace directly; inspect.getmembers would sort and
+    # copy it and test every attribute with isclass()
+    for name, obj in vars(module).items():
+        if (isinstance(obj, type) and obj.__module__ == module_name
+                and issubclass(obj, FileHandler) and obj is not FileHandler):
+            # Infer the format from the class name (e.g., "CsvHandler" - "csv")
+            format_name = name.replace("Handler", "").lower()
+            _HANDLERS.setdefault(format_name, obj)
+
 
 def _discover_handlers():
     """
-    Dynamically imports all modules in the 'plugins' package and registers
-    any FileHandler subclasses found.
+    Dynamically imports the modules in the 'plugins' package that are not
+    bundled in _LAZY and registers any FileHandler subclasses found. This
+    keeps drop-in plugins working without importing the bundled ones.
     """
-    if _HANDLERS:  # Discover only once
+    global _DISCOVERED
+    if _DISCOVERED:  # Discover only once
         return
 
-    # This dynamically finds the path to the 'plugins' package.
-    # Replace 'plugins' with the actual package name if different.
-    package_path = os.path.dirname(__file__)
-    package_name = os.path.basename(package_path)
+    with _DISCOVERY_LOCK:
+        if _DISCOVERED:  # Another thread finished the scan while we waited
+            return
+
+        # This dynamically finds the path to the 'plugins' package.
+        # Replace 'plugins' with the actual package name if different.
+        package_path = os.path.dirname(__file__)
+        package_name = os.path.basename(package_path)
+
+        # Plugins are the package's .py files. Listing them directly avoids
+        # importing pkgutil, and its own imports, for a single directory scan.
+        with os.scandir(package_path) as entries:
+            module_names = sorted(entry.name[:-3] for entry in entries if entry.name.endswith('.py'))
+
+        for module_name in module_names:
+            if module_name in _SKIP_DISCOVERY or not module_name.isidentifier():
+                continue
+            try:
+                # Import the module dynamically; decorated handlers register
+                # themselves as it runs
+                registered = len(_HANDLERS)
+                module = __import__(f"{package_name}.{module_name}", fromlist=["*"])
+                if len(_HANDLERS) == registered:
+                    _register_module_handlers(module)
+            except Exception:
+                # Silently skip modules that can't be imported
+                pass
+
+        _DISCOVERED = True
+
+
+def _import_by_convention(ext: str):
+    """
+    Imports the plugin module named after an extension (the '<ext>_handler'
+    convention the bundled plugins follow) and returns the handler class it
+    registers for that extension, or None.
+
+    This finds a conventionally named drop-in plugin with a single import,
+    so only handlers named some other way need the full package scan.
+    """
+    package_name = os.path.basename(os.path.dirname(__file__))
+    module_path = f"{package_name}.{ext}_handler"
+    try:
+        module = import_module(module_path)
+    except Exception:
+        # No such module, or one that can't be imported; the scan skips
+        # those too
+        return None
+
+    if ext not in _HANDLERS:
+        _register_module_handlers(module)
+    return _HANDLERS.get(ext)
+
+
+# The one instance of each handler class, shared by every extension the
+# class is registered for. The lock stops threads that look a format up for
+# the first time at once from each creating their own instance.
+_INSTANCES: Dict[type, FileHandler] = {}
+_INSTANCE_LOCK = threading.Lock()
+
+def _handler_instance(handler_class: type) -> FileHandler:
+    """
+    Returns the shared instance of a handler class, creating it on first use.
+    """
+    with _INSTANCE_LOCK:
+        instance = _INSTANCES.get(handler_class)
+        if instance is None:
+            instance = _INSTANCES[handler_class] = handler_class()
+        return instance
+
 
-    for _, module_name, _ in pkgutil.iter_modules([package_path]):
+# Handlers found by get_handler_or_none(), keyed by the extension exactly as
+# the caller spelled it. Repeated lookups, the common case in batch loops,
+# are a single dict hit that skips lowercasing and the lru_cache wrapper.
+# Only hits are kept, so misses cannot grow it.
+_RESOLVED: Dict[str, FileHandler] = {}
+
+# Bounded, as extensions may come from user input (batch manifests, library
+# callers) and misses are cached too; the bundled formats fit many times over.
+@functools.lru_cache(maxsize=128)
+def _build_handler(ext: str) -> Optional[FileHandler]:
+    """
+    Instantiates the handler registered for an already-lowercased extension,
+    or returns None if there is none.
+
+    Results are cached per extension, misses included, for the most recent
+    128 extensions. Handlers keep no per-file state, so a single instance
+    of each class serves every conversion, and a recently seen unknown
+    extension is not searched for again.
+    """
+    lazy_entry = _LAZY.get(ext)
+    if lazy_entry is not None:
+        module_name, class_name = lazy_entry
+        package_name = os.path.basename(os.path.dirname(__file__))
         try:
-            # Import the module dynamically
-            module = __import__(f"{package_name}.{module_name}", fromlist=["*"])
-
-            # Look for classes within the imported module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Check if it's a subclass of FileHandler but not FileHandler itself
-                try:
-                    if issubclass(obj, FileHandler) and obj is not FileHandler:
-                        # Infer the format from the class name (e.g., "CsvHandler" - "csv")
-                        format_name = name.replace("Handler", "").lower()
-                        _HANDLERS[format_name] = obj
-                        # print(f"Registered handler for '{format_name}': {name}")  # Commented for cleaner output
-                except Exception:
-                    # Silently skip classes that can't be checked
-                    pass
-        except Exception:
-            # Silently skip modules that can't be imported
-            pass
+            module = import_module(f"{package_name}.{module_name}")
+        except ImportError:
+            # The plugin's dependencies are not installed
+            return None
+        handler_class = getattr(module, class_name)
+    else:
+        handler_class = _HANDLERS.get(ext)
+        if handler_class is None and ext.isidentifier():
+            handler_class = _import_by_convention(ext)
+        if handler_class is None:
+            _discover_handlers() # Ensure third-party handlers are loaded
+            handler_class = _HANDLERS.get(ext)
+        if handler_class is None:
+            return None
+
+    return _handler_instance(handler_class)
+
+
+def get_handler_or_none(file_extension: str) -> Optional[FileHandler]:
+    """
+    Returns the file handler for the given file extension, or None if no
+    handler is registered for it.
+
+    This is the non-raising variant of get_handler(), intended for callers
+    that probe formats and treat a miss as a normal outcome. Handlers are
+    created once per extension and reused on later calls.
+
+    Args:
+        file_extension (str): The file extension to get a handler for,
+                              without the leading dot.
+
+    Returns:
+        Optional[FileHandler]: An instance of the appropriate handler, or None.
+    """
+    handler = _RESOLVED.get(file_extension)
+    if handler is not None:
+        return handler
+
+    ext = file_extension.lower()
+    ext = _CANONICAL.get(ext, ext)
+    handler = _build_handler(ext)
+    if handler is None and ext in _HANDLERS:
+        # Registered with register_handler() after a cached miss
+        _build_handler.cache_clear()
+        handler = _build_handler(ext)
+    if handler is not None:
+        _RESOLVED[file_extension] = handler
+    return handler
+
+
+def supports(file_extension: str) -> bool:
+    """
+    Returns whether a handler is registered for the given file extension,
+    without importing the bundled plugin modules or raising.
+
+    This reports registration only. A bundled plugin whose dependencies
+    are not installed is still registered, but get_handler_or_none()
+    returns None for it, as it cannot be imported; call that instead to
+    find out whether a handler can actually be used.
+
+    Args:
+        file_extension (str): The file extension to check, with or
+                              without the leading dot.
+
+    Returns:
+        bool: True if a handler class is registered for the extension.
+    """
+    ext = file_extension.lower().lstrip('.')
+    if ext in SUPPORTED_EXTS:
+        return True
+
+    _discover_handlers() # Check third-party handlers
+    return ext in _HANDLERS
 
 
 def get_handler(file_extension: str) -> FileHandler:
     """
     Returns an instantiated file handler for the given file extension.
+    The same instance is returned for repeated lookups of an extension.
 
     The file extension should be provided without the leading dot.
     e.g., 'csv', 'json'
@@ -86,14 +286,12 @@ def get_handler(file_extension: str) -> FileHandler:
     Raises:
         UnsupportedFormatError: If no handler is found for the extension.
     """
-    _discover_handlers() # Ensure handlers are loaded
-    
-    handler_class = _HANDLERS.get(file_extension.lower())
-    
-    if not handler_class:
+    handler = get_handler_or_none(file_extension)
+
+    if handler is None:
         raise UnsupportedFormatError(file_extension, "No handler registered for this file type")
-        
-    return handler_class()
+
+    return handler
 
 
 # Example Usage (for demonstration):
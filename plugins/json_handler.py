@@ -2,11 +2,27 @@
 Concrete implementation of FileHandler for JSON files.
 
 This module uses Python's built-in 'json' library to handle the reading
-and writing of data in JavaScript Object Notation format.
+and writing of data in JavaScript Object Notation format. When installed,
+orjson is used to parse files and ijson to stream very large ones.
 """
 
+import os
 import json
-from typing import List, Dict, Any
+import mmap
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+# Optional: orjson parses JSON several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: ijson parses the elements of a JSON array one at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Try to import from project structure, fall back to dummy classes
 try:
@@ -28,6 +44,137 @@ except ImportError:
             def write(self, file_path: str, data: List[Dict[str, Any]]): pass
 
 
+# Files larger than this are streamed with ijson, when it is installed, so
+# that only one record at a time is held as Python objects.
+STREAM_THRESHOLD = 64 << 20
+
+# Files larger than this are memory-mapped and parsed in place by orjson,
+# rather than first being read into a bytes object as large as the file.
+MMAP_THRESHOLD = 16 << 20
+
+# Output written a batch at a time goes through a buffer this large, so a
+# long stream of records is flushed to disk in few, large write() calls.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Records encoded per call when writing from an iterator.
+STREAM_BATCH_SIZE = 8192
+
+
+def _json_decode(raw) -> Any:
+    """
+    Parses JSON with the json module, which takes bytes but not buffers.
+    """
+    return json.loads(raw if isinstance(raw, bytes) else bytes(raw))
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serializes data to UTF-8 JSON with the json module. The output is
+    compact unless an indent is given.
+    """
+    # Like orjson, write non-ASCII text as UTF-8 rather than \uXXXX escapes,
+    # which saves the json module an escaping pass and keeps output small
+    separators = (',', ':') if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+
+def _orjson_decode(raw) -> Any:
+    """
+    Parses JSON from bytes or any buffer with orjson.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects a few things the json module accepts, such as NaN
+        # and integers wider than 64 bits, so let json decide
+        return _json_decode(raw)
+
+
+def _orjson_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serializes data to UTF-8 JSON with orjson, which supports compact and
+    two-space output. Anything else is left to the json module.
+    """
+    if indent in (None, 2):
+        # OPT_NON_STR_KEYS writes keys such as the None key in CSV rows
+        # with extra fields the way the json module does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            # orjson refuses integers wider than 64 bits, among others
+            pass
+    return _json_dumps(data, indent)
+
+
+# The backend is chosen once, here, rather than on every call. Both decoders
+# accept bytes; only orjson's parses a memory-mapped file without a copy.
+if orjson is not None:
+    _decode, _dumps, _DECODES_BUFFERS = _orjson_decode, _orjson_dumps, True
+else:
+    _decode, _dumps, _DECODES_BUFFERS = _json_decode, _json_dumps, False
+
+
+def _load_file(jsonfile) -> Any:
+    """
+    Parses an open binary JSON file. Large files are memory-mapped when
+    the backend can parse them in place, so the pages are read as the
+    parser reaches them and no copy of the whole file is held while the
+    result is built.
+    """
+    if _DECODES_BUFFERS and os.fstat(jsonfile.fileno()).st_size > MMAP_THRESHOLD:
+        with mmap.mmap(jsonfile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _decode(view)
+    return _decode(jsonfile.read())
+
+
+def _first_byte(jsonfile) -> bytes:
+    """
+    Returns the first non-whitespace byte of a binary file, or b'' if there
+    is none, then rewinds the file.
+    """
+    try:
+        while True:
+            chunk = jsonfile.read(64)
+            if not chunk:
+                return b''
+            chunk = chunk.lstrip()
+            if chunk:
+                return chunk[:1]
+    finally:
+        jsonfile.seek(0)
+
+
+def _check_root(file_path: str, jsonfile):
+    """
+    Rejects a file whose root is not a JSON array before it is parsed, by
+    looking at its first byte.
+    """
+    first = _first_byte(jsonfile)
+    if first != b'[':
+        if not first:
+            raise FileProcessingError(file_path, "Invalid JSON format")
+        raise FileProcessingError(
+            file_path, "JSON content has wrong structure: JSON content must be a list of objects."
+        )
+
+
+def _should_stream(file_path: str) -> bool:
+    """
+    Returns whether a file is large enough to stream rather than load.
+    """
+    if ijson is None:
+        return False
+    try:
+        return os.path.getsize(file_path) > STREAM_THRESHOLD
+    except OSError:
+        # Let the regular path report the missing or unreadable file
+        return False
+
+
 class JsonHandler(FileHandler):
     """
     Handles reading and writing of JSON files.
@@ -50,39 +197,143 @@ class JsonHandler(FileHandler):
             FileProcessingError: If the file is not found, cannot be read,
                                  or is not valid JSON.
         """
+        if _should_stream(file_path):
+            return list(self._iter_stream(file_path))
+
         try:
-            with open(file_path, mode='r', encoding='utf-8') as jsonfile:
-                data = json.load(jsonfile)
-                # We enforce that the root of the JSON is a list.
-                if not isinstance(data, list):
-                    raise TypeError("JSON content must be a list of objects.")
-                return data
-        except FileNotFoundError:
-            raise FileProcessingError(file_path, "JSON file not found")
-        except json.JSONDecodeError:
-            raise FileProcessingError(file_path, "Invalid JSON format")
-        except TypeError as e:
-            raise FileProcessingError(file_path, f"JSON content has wrong structure: {e}")
-        except Exception as e:
-            raise FileProcessingError(file_path, f"An error occurred while reading the JSON: {e}")
+            with open(file_path, mode='rb') as jsonfile:
+                # We enforce that the root of the JSON is a list. A document
+                # that starts with '[' and parses can only be one.
+                _check_root(file_path, jsonfile)
+                return _load_file(jsonfile)
+        except FileNotFoundError as e:
+            raise FileProcessingError(file_path, "JSON file not found") from e
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # orjson's decode error is a json.JSONDecodeError too
+            raise FileProcessingError(file_path, "Invalid JSON format") from e
+        except OSError as e:
+            raise FileProcessingError(file_path, "An error occurred while reading the JSON") from e
+
+    def iter_read(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of a JSON file. Files above STREAM_THRESHOLD are
+        parsed incrementally with ijson when it is installed; smaller ones
+        are loaded whole, which is faster.
+
+        Args:
+            file_path (str): The path to the input JSON file.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The content of the JSON file, record by record.
 
-    def write(self, file_path: str, data: List[Dict[str, Any]]) -> None:
+        Raises:
+            FileProcessingError: If the file is not found, cannot be read,
+                                 or is not valid JSON.
+        """
+        if _should_stream(file_path):
+            return self._iter_stream(file_path)
+        return iter(self.read(file_path))
+
+    def _iter_stream(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parses the elements of a JSON array one at a time with ijson.
+        """
+        try:
+            with open(file_path, mode='rb') as jsonfile:
+                _check_root(file_path, jsonfile)
+                # use_float keeps numbers as float, as json.load returns them
+                yield from ijson.items(jsonfile, 'item', use_float=True)
+        except FileNotFoundError as e:
+            raise FileProcessingError(file_path, "JSON file not found") from e
+        except (ijson.JSONError, UnicodeDecodeError) as e:
+            raise FileProcessingError(file_path, "Invalid JSON format") from e
+        except OSError as e:
+            raise FileProcessingError(file_path, "An error occurred while reading the JSON") from e
+
+    def write(self, file_path: str, data: List[Dict[str, Any]], *, indent: Optional[int] = None) -> None:
         """
         Writes a list of dictionaries to a JSON file.
 
+        The output is compact by default, without any whitespace between
+        tokens; pretty-printed output is two to three times larger and
+        slower to write.
+
         Args:
             file_path (str): The path to the output JSON file.
             data (List[Dict[str, Any]]): The data to be written.
+            indent (Optional[int]): Spaces to indent nested values by, for
+                                    human-readable output.
 
         Raises:
             FileProcessingError: If the file cannot be written.
         """
         try:
-            with open(file_path, mode='w', encoding='utf-8') as jsonfile:
-                # indent=4 makes the output human-readable.
-                json.dump(data, jsonfile, indent=4)
-        except IOError as e:
-            raise FileProcessingError(file_path, f"Could not write to JSON file: {e}")
-        except Exception as e:
-            raise FileProcessingError(file_path, f"An unexpected error occurred during JSON writing: {e}")
+            # The document is encoded in one call and written in one go,
+            # instead of as the many small chunks json.dump() produces.
+            encoded = _dumps(data, indent)
+            with open(file_path, mode='wb') as jsonfile:
+                jsonfile.write(encoded)
+        except OSError as e:
+            raise FileProcessingError(file_path, "Could not write to JSON file") from e
+        except (TypeError, ValueError) as e:
+            # Values JSON cannot represent; orjson's encode error is a TypeError
+            raise FileProcessingError(file_path, "The data contains values that cannot be written as JSON") from e
 
+    def write_stream(self, file_path: str, data: Iterable[Dict[str, Any]], *, indent: Optional[int] = None) -> None:
+        """
+        Writes records to a JSON file as they are produced, encoding them
+        STREAM_BATCH_SIZE at a time instead of collecting them into a list.
+
+        Args:
+            file_path (str): The path to the output JSON file.
+            data (Iterable[Dict[str, Any]]): The records to be written.
+            indent (Optional[int]): Spaces to indent nested values by, for
+                                    human-readable output.
+
+        Raises:
+            FileProcessingError: If the file cannot be written.
+        """
+        records = iter(data)
+        batches = iter(lambda: list(islice(records, STREAM_BATCH_SIZE)), [])
+        self.write_batches(file_path, batches, indent=indent)
+
+    def write_batches(self, file_path: str, batches: Iterable[List[Dict[str, Any]]], *,
+                      indent: Optional[int] = None) -> None:
+        """
+        Writes batches of records to a single JSON array, encoding one whole
+        batch per call. The output is the same as write() produces for all
+        the records at once.
+
+        Args:
+            file_path (str): The path to the output JSON file.
+            batches (Iterable[List[Dict[str, Any]]]): The records to be written,
+                                                      grouped into lists.
+            indent (Optional[int]): Spaces to indent nested values by, for
+                                    human-readable output.
+
+        Raises:
+            FileProcessingError: If the file cannot be written.
+        """
+        try:
+            with open(file_path, mode='wb', buffering=WRITE_BUFFER_SIZE) as jsonfile:
+                jsonfile.write(b'[')
+                separator = b''
+                for batch in batches:
+                    if not batch:
+                        continue
+                    # Each batch is encoded as an array and its brackets are
+                    # dropped; with an indent, the newline before the closing
+                    # bracket goes too, and is written once at the end
+                    encoded = _dumps(batch, indent)
+                    jsonfile.write(separator)
+                    jsonfile.write(encoded[1:-1].rstrip(b'\n'))
+                    separator = b','
+                jsonfile.write(b'\n]' if separator and indent is not None else b']')
+        except FileProcessingError:
+            # Raised by the upstream reader while it was being consumed
+            raise
+        except OSError as e:
+            raise FileProcessingError(file_path, "Could not write to JSON file") from e
+        except (TypeError, ValueError) as e:
+            # Values JSON cannot represent; orjson's encode error is a TypeError
+            raise FileProcessingError(file_path, "The data contains values that cannot be written as JSON") from e
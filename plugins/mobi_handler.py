@@ -6,19 +6,25 @@ might be limited without additional tools.
 """
 
 import os
-from typing import List, Dict, Any
+import struct
+import zipfile
+from typing import List, Dict, Any, Optional
 
 # Try to import from project structure, fall back to dummy classes
 try:
     from ..core.exceptions import FileProcessingError
     from .base_handler import FileHandler
+    from ._ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
 except ImportError:
     try:
         # Try absolute imports for installed package
         from core.exceptions import FileProcessingError
         from plugins.base_handler import FileHandler
+        from plugins._ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
     except ImportError:
         # For standalone testing, we'll define dummy classes.
+        from _ebook_common import _html_text, _ebook_convert_cmd, _run_ebook_convert
+
         class FileProcessingError(Exception):
             def __init__(self, path, msg):
                 super().__init__(f"{msg}: {path}")
@@ -28,6 +34,110 @@ except ImportError:
             def write(self, file_path: str, data): pass
 
 
+# ebooklib is a heavy import and only needed once a MOBI file is actually
+# read or written, so it is never imported at module level. It is imported
+# on first use and kept here, so later calls skip the import machinery.
+_ebooklib = None
+_epub = None
+
+
+def _load_ebooklib():
+    """
+    Returns the (ebooklib, ebooklib.epub) modules, importing them on the
+    first call. Raises ImportError if ebooklib is not installed.
+    """
+    global _ebooklib, _epub
+    if _ebooklib is None:
+        import ebooklib
+        from ebooklib import epub
+        _ebooklib, _epub = ebooklib, epub
+    return _ebooklib, _epub
+
+
+# ebook-convert is given this many seconds per MiB of input, so large books
+# are not cut off, up to CONVERT_TIMEOUT_MAX seconds
+CONVERT_SECONDS_PER_MB = 3
+CONVERT_TIMEOUT_MAX = 600
+
+
+def _convert_timeout(source_path: str, minimum: int) -> int:
+    """
+    Returns the timeout, in seconds, for converting source_path with
+    ebook-convert: scaled with the file's size, but at least minimum.
+    """
+    size_mb = os.path.getsize(source_path) / (1 << 20)
+    return max(minimum, min(CONVERT_TIMEOUT_MAX, int(size_mb * CONVERT_SECONDS_PER_MB)))
+
+
+# EXTH record types holding the metadata we report
+_EXTH_AUTHOR = 100
+_EXTH_TITLE = 503
+
+# MOBI text encodings, by the code stored in the MOBI header
+_MOBI_ENCODINGS = {1252: 'cp1252', 65001: 'utf-8'}
+
+# Big-endian header fields, compiled once rather than parsed from a format
+# string on each unpack
+_U32 = struct.Struct('>I')
+_U32_PAIR = struct.Struct('>II')
+_MOBI_FIELDS = struct.Struct('>III')  # header length, MOBI type, text encoding
+
+
+def _parse_mobi_header(f) -> Optional[Dict[str, str]]:
+    """
+    Reads the title and author of a MOBI book straight from its headers,
+    reading only the byte ranges that hold them.
+
+    The file is a Palm database: a 78-byte header, then a table of record
+    offsets. Record 0 starts with a 16-byte PalmDOC header followed by the
+    MOBI header, which locates the book's full name and flags whether an
+    EXTH header, holding records such as the author (type 100) and title
+    (type 503), follows it.
+
+    Returns:
+        Optional[Dict[str, str]]: The 'title' and 'author' found, possibly
+                                  neither, or None if the file is not a
+                                  MOBI book.
+    """
+    pdb = f.read(86)  # PDB header plus the first record-table entry
+    if len(pdb) < 86 or pdb[60:68] != b'BOOKMOBI':
+        return None
+    (record0,) = _U32.unpack_from(pdb, 78)
+
+    f.seek(record0)
+    header = f.read(132)  # PalmDOC header and the MOBI fields used below
+    if len(header) < 132 or header[16:20] != b'MOBI':
+        return None
+    mobi_length, _, encoding_code = _MOBI_FIELDS.unpack_from(header, 20)
+    full_name_offset, full_name_length = _U32_PAIR.unpack_from(header, 84)
+    (exth_flags,) = _U32.unpack_from(header, 128)
+    encoding = _MOBI_ENCODINGS.get(encoding_code, 'cp1252')
+
+    metadata = {}
+    if full_name_length:
+        f.seek(record0 + full_name_offset)
+        metadata['title'] = f.read(full_name_length).decode(encoding, errors='replace')
+
+    if exth_flags & 0x40:
+        f.seek(record0 + 16 + mobi_length)
+        exth = f.read(12)
+        if len(exth) == 12 and exth[:4] == b'EXTH':
+            exth_length, count = _U32_PAIR.unpack_from(exth, 4)
+            records = f.read(max(exth_length - 12, 0))
+            pos = 0
+            for _ in range(count):
+                if pos + 8 > len(records):
+                    break
+                record_type, length = _U32_PAIR.unpack_from(records, pos)
+                if length < 8:
+                    break
+                if record_type == _EXTH_AUTHOR:
+                    metadata['author'] = records[pos + 8:pos + length].decode(encoding, errors='replace')
+                elif record_type == _EXTH_TITLE:
+                    metadata['title'] = records[pos + 8:pos + length].decode(encoding, errors='replace')
+                pos += length
+
+    return metadata
 
 
 class MobiHandler(FileHandler):
@@ -52,111 +162,79 @@ class MobiHandler(FileHandler):
             FileProcessingError: If the file cannot be read or processed.
         """
         try:
-            import ebooklib
-            from ebooklib import epub
-            from bs4 import BeautifulSoup
+            ebooklib, epub = _load_ebooklib()
             import tempfile
-            import subprocess
-            import re
             
             # First try to convert MOBI to EPUB using ebook-convert if available
             # This requires Calibre to be installed on the system
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_epub:
-                    temp_epub_path = tmp_epub.name
-                
-                # Try using ebook-convert command from Calibre
-                ebook_convert_cmd = 'ebook-convert'
-                # Check if Calibre is installed in the typical Windows location
-                import os
-                calibre_path = r'C:\Program Files\Calibre2\ebook-convert.exe'
-                if os.path.exists(calibre_path):
-                    ebook_convert_cmd = calibre_path
-                
-                result = subprocess.run(
-                    [ebook_convert_cmd, file_path, temp_epub_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    # Successfully converted, now read the EPUB
-                    book = epub.read_epub(temp_epub_path)
-                    content_data = []
-                    
-                    # Extract metadata
-                    title = book.get_metadata('DC', 'title')
-                    author = book.get_metadata('DC', 'creator')
+            if _ebook_convert_cmd() is not None:
+                fd, temp_epub_path = tempfile.mkstemp(suffix='.epub')
+                os.close(fd)
+                try:
+                    if _run_ebook_convert(file_path, temp_epub_path, timeout=_convert_timeout(file_path, minimum=30)):
+                        # Successfully converted, now read the EPUB
+                        try:
+                            book = epub.read_epub(temp_epub_path)
+                        except (epub.EpubException, zipfile.BadZipFile, KeyError) as e:
+                            raise FileProcessingError(file_path, f"Could not read the EPUB converted from the MOBI file: {e}")
+                        content_data = []
                     
-                    content_data.append({
-                        'type': 'metadata',
-                        'title': title[0][0] if title else 'Unknown',
-                        'author': author[0][0] if author else 'Unknown',
-                        'content': f"Title: {title[0][0] if title else 'Unknown'}\nAuthor: {author[0][0] if author else 'Unknown'}"
-                    })
+                        # Extract metadata
+                        title = book.get_metadata('DC', 'title')
+                        author = book.get_metadata('DC', 'creator')
                     
-                    # Extract text content from chapters
-                    for item in book.get_items():
-                        if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                            soup = BeautifulSoup(item.get_content(), 'html.parser')
-                            text = soup.get_text().strip()
-                            if text:
-                                content_data.append({
-                                    'type': 'chapter',
-                                    'title': getattr(item, 'title', 'Chapter'),
-                                    'content': text
-                                })
+                        content_data.append({
+                            'type': 'metadata',
+                            'title': title[0][0] if title else 'Unknown',
+                            'author': author[0][0] if author else 'Unknown',
+                            'content': f"Title: {title[0][0] if title else 'Unknown'}\nAuthor: {author[0][0] if author else 'Unknown'}"
+                        })
                     
-                    # Clean up temp file
-                    import os
+                        # Extract text content from chapters
+                        for item in book.get_items():
+                            if item.get_type() == ebooklib.ITEM_DOCUMENT:
+                                text = _html_text(item.get_content())
+                                if text:
+                                    content_data.append({
+                                        'type': 'chapter',
+                                        'title': getattr(item, 'title', 'Chapter'),
+                                        'content': text
+                                    })
+
+                        return content_data if content_data else [{
+                            'type': 'text',
+                            'content': 'No readable content found in MOBI file'
+                        }]
+                finally:
+                    # Clean up temp file, also when the conversion failed or timed out
                     try:
                         os.unlink(temp_epub_path)
-                    except:
+                    except OSError:
                         pass
-                    
-                    return content_data if content_data else [{
-                        'type': 'text',
-                        'content': 'No readable content found in MOBI file'
-                    }]
-                
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                # Calibre not available, fall back to basic file reading
-                pass
             
-            # Fallback: try to extract basic information by reading the file directly
-            # MOBI files have some readable metadata at the beginning
+            # Fallback: read the title and author from the MOBI headers
             with open(file_path, 'rb') as f:
-                data = f.read(1024)  # Read first 1KB
-                
-                # Try to extract title from the MOBI header
-                try:
-                    # MOBI files often have readable text in the header
-                    text_data = data.decode('utf-8', errors='ignore')
-                    
-                    # Look for common metadata patterns
-                    title_match = re.search(r'<title>(.*?)</title>', text_data, re.IGNORECASE)
-                    author_match = re.search(r'<author>(.*?)</author>', text_data, re.IGNORECASE)
-                    
-                    content_data = []
-                    
-                    if title_match or author_match:
-                        content_data.append({
-                            'type': 'metadata',
-                            'title': title_match.group(1) if title_match else 'Unknown',
-                            'author': author_match.group(1) if author_match else 'Unknown',
-                            'content': f"Title: {title_match.group(1) if title_match else 'Unknown'}\nAuthor: {author_match.group(1) if author_match else 'Unknown'}"
-                        })
-                    
+                metadata = _parse_mobi_header(f)
+
+            if metadata is not None:
+                content_data = []
+
+                if metadata:
+                    title = metadata.get('title', 'Unknown')
+                    author = metadata.get('author', 'Unknown')
                     content_data.append({
-                        'type': 'note',
-                        'content': 'MOBI file detected. For full text extraction, install Calibre (ebook-convert command).'
+                        'type': 'metadata',
+                        'title': title,
+                        'author': author,
+                        'content': f"Title: {title}\nAuthor: {author}"
                     })
-                    
-                    return content_data
-                    
-                except UnicodeDecodeError:
-                    pass
+
+                content_data.append({
+                    'type': 'note',
+                    'content': 'MOBI file detected. For full text extraction, install Calibre (ebook-convert command).'
+                })
+
+                return content_data
             
             # If all else fails, return a basic response
             return [{
@@ -167,7 +245,9 @@ class MobiHandler(FileHandler):
             
         except FileNotFoundError:
             raise FileProcessingError(file_path, "MOBI file not found")
-        except Exception as e:
+        except ImportError as e:
+            raise FileProcessingError(file_path, f"Reading MOBI files requires ebooklib, and lxml or beautifulsoup4: {e}")
+        except OSError as e:
             raise FileProcessingError(file_path, f"An error occurred while reading the MOBI file: {e}")
 
     def write(self, file_path: str, data: List[Dict[str, Any]]) -> None:
@@ -189,10 +269,8 @@ class MobiHandler(FileHandler):
             raise ValueError("Input data for MOBI writing cannot be empty.")
         
         try:
-            import ebooklib
-            from ebooklib import epub
+            ebooklib, epub = _load_ebooklib()
             import tempfile
-            import subprocess
             import html
             
             # Create an EPUB first
@@ -202,12 +280,11 @@ class MobiHandler(FileHandler):
             title = "Converted Document"
             author = "File Converter"
             
-            # Extract metadata if available
-            for item in data:
-                if isinstance(item, dict) and item.get('type') == 'metadata':
-                    title = item.get('title', title)
-                    author = item.get('author', author)
-                    break
+            # Extract metadata if available, from the first metadata record
+            meta = next((item for item in data if isinstance(item, dict) and item.get('type') == 'metadata'), None)
+            if meta is not None:
+                title = meta.get('title', title)
+                author = meta.get('author', author)
             
             book.set_identifier('converted_doc')
             book.set_title(title)
@@ -236,17 +313,17 @@ class MobiHandler(FileHandler):
                         content = str(item)
                     
                     if content and content.strip():
-                        # Create HTML content
-                        html_content = f'<html><head><title>{html.escape(chapter_title)}</title></head><body>'
-                        html_content += f'<h1>{html.escape(chapter_title)}</h1>'
+                        # Create HTML content, escaping the title once and
+                        # joining the pieces in a single pass
+                        title_esc = html.escape(chapter_title)
+                        body_parts = ['<html><head><title>', title_esc, '</title></head><body><h1>', title_esc, '</h1>']
                         
                         # Convert content to HTML paragraphs
-                        paragraphs = content.split('\n')
-                        for para in paragraphs:
-                            if para.strip():
-                                html_content += f'<p>{html.escape(para.strip())}</p>'
+                        paragraphs = (para.strip() for para in content.splitlines())
+                        body_parts.extend(f'<p>{html.escape(para)}</p>' for para in paragraphs if para)
                         
-                        html_content += '</body></html>'
+                        body_parts.append('</body></html>')
+                        html_content = ''.join(body_parts)
                         
                         # Create chapter
                         chapter = epub.EpubHtml(
@@ -265,10 +342,11 @@ class MobiHandler(FileHandler):
                     content = str(item)
                     if content.strip():
                         chapter_title = f'Chapter {chapter_num}'
-                        html_content = f'<html><head><title>{html.escape(chapter_title)}</title></head><body>'
-                        html_content += f'<h1>{html.escape(chapter_title)}</h1>'
-                        html_content += f'<p>{html.escape(content)}</p>'
-                        html_content += '</body></html>'
+                        title_esc = html.escape(chapter_title)
+                        html_content = ''.join([
+                            '<html><head><title>', title_esc, '</title></head><body><h1>', title_esc, '</h1>',
+                            '<p>', html.escape(content), '</p></body></html>'
+                        ])
                         
                         chapter = epub.EpubHtml(
                             title=chapter_title,
@@ -295,68 +373,58 @@ class MobiHandler(FileHandler):
             book.add_item(epub.EpubNav())
             book.spine = ['nav'] + chapters
             
-            # First try to create MOBI directly using Calibre
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_epub:
-                    temp_epub_path = tmp_epub.name
-                
-                # Write EPUB to temp file
-                epub.write_epub(temp_epub_path, book)
-                
-                # Convert EPUB to MOBI using ebook-convert
-                ebook_convert_cmd = 'ebook-convert'
-                # Check if Calibre is installed in the typical Windows location
-                import os
-                calibre_path = r'C:\Program Files\Calibre2\ebook-convert.exe'
-                if os.path.exists(calibre_path):
-                    ebook_convert_cmd = calibre_path
-                
-                result = subprocess.run(
-                    [ebook_convert_cmd, temp_epub_path, file_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                # Clean up temp file
-                import os
+            # First try to create MOBI directly using Calibre. When Calibre is
+            # missing, skip straight to the HTML fallback without writing the
+            # temporary EPUB
+            if _ebook_convert_cmd() is not None:
+                fd, temp_epub_path = tempfile.mkstemp(suffix='.epub')
+                os.close(fd)
                 try:
-                    os.unlink(temp_epub_path)
-                except:
-                    pass
+                    # Write EPUB to temp file
+                    epub.write_epub(temp_epub_path, book)
+                
+                    # Convert EPUB to MOBI using ebook-convert
+                    converted = _run_ebook_convert(
+                        temp_epub_path, file_path, timeout=_convert_timeout(temp_epub_path, minimum=60)
+                    )
+                finally:
+                    # Clean up temp file, also when the conversion failed or timed out
+                    try:
+                        os.unlink(temp_epub_path)
+                    except OSError:
+                        pass
                 
-                if result.returncode == 0:
+                if converted:
                     return  # Success!
-                else:
-                    raise subprocess.CalledProcessError(result.returncode, 'ebook-convert')
             
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                # Calibre not available, create an HTML file instead
-                html_file_path = file_path.replace('.mobi', '.html')
-                
-                # Create a single HTML file with all content
-                html_content = f'<html><head><title>{html.escape(title)}</title></head><body>'
-                html_content += f'<h1>{html.escape(title)}</h1>'
-                html_content += f'<p><em>Author: {html.escape(author)}</em></p>'
-                
-                for chapter in chapters:
-                    # Extract content from each chapter
-                    chapter_content = chapter.content
-                    if '<body>' in chapter_content:
-                        body_start = chapter_content.find('<body>') + 6
-                        body_end = chapter_content.find('</body>')
-                        if body_end > body_start:
-                            html_content += chapter_content[body_start:body_end]
-                
-                html_content += '</body></html>'
-                
-                with open(html_file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                raise FileProcessingError(
-                    file_path,
-                    f"Calibre not found. Created HTML file instead: {html_file_path}. Install Calibre for MOBI support."
-                )
+            # Calibre not available, create an HTML file instead
+            html_file_path = file_path.replace('.mobi', '.html')
+            
+            # Create a single HTML file with all content, collected in a
+            # list and joined once
+            parts = [
+                f'<html><head><title>{html.escape(title)}</title></head><body>',
+                f'<h1>{html.escape(title)}</h1>',
+                f'<p><em>Author: {html.escape(author)}</em></p>',
+            ]
+            
+            for chapter in chapters:
+                # Extract the body of each chapter, scanning it only once
+                _, body_tag, after = chapter.content.partition('<body>')
+                if body_tag:
+                    body, end_tag, _ = after.partition('</body>')
+                    if end_tag:
+                        parts.append(body)
+            
+            parts.append('</body></html>')
+            
+            with open(html_file_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
+            
+            raise FileProcessingError(
+                file_path,
+                f"Calibre not found. Created HTML file instead: {html_file_path}. Install Calibre for MOBI support."
+            )
             
         except ValueError as e:
             raise e
@@ -55,14 +55,21 @@ class PptxHandler(FileHandler):
             content_data = []
             
             for slide_num, slide in enumerate(presentation.slides, 1):
-                slide_content = ""
+                # Collected in a list and joined once, one line per shape
+                # with text, rather than concatenated shape by shape
+                parts = []
                 for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        slide_content += shape.text.strip() + "\n"
+                    # Fetched once; hasattr() followed by shape.text would
+                    # build the text twice
+                    text = getattr(shape, 'text', None)
+                    if text:
+                        text = text.strip()
+                        if text:
+                            parts.append(text)
                 content_data.append({
                     'type': 'slide',
                     'number': slide_num,
-                    'content': slide_content.strip()
+                    'content': '\n'.join(parts)
                 })
             
             return content_data
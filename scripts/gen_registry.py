@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Generates plugins/_registry.py, the extension -> handler table of the
+bundled plugins.
+
+Each plugins/*_handler.py module is parsed with ast, without importing it,
+and every top-level class deriving from FileHandler is recorded under the
+extension passed to its @register_handler decorator or, without one, under
+its class name minus 'Handler', lowercased (the rule discovery uses). The
+handler factory then finds bundled handlers without scanning the package.
+
+Usage:
+  python scripts/gen_registry.py          # rewrite plugins/_registry.py
+  python scripts/gen_registry.py --check  # exit 1 if it is out of date
+"""
+
+import argparse
+import ast
+import os
+import sys
+from typing import Dict, Optional
+
+PLUGINS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plugins')
+REGISTRY_PATH = os.path.join(PLUGINS_DIR, '_registry.py')
+
+HEADER = '''"""
+Extension -> handler registry for the bundled plugins, as
+'<module>:<class>' with the module relative to this package.
+
+Generated by scripts/gen_registry.py from the handler classes in this
+package; do not edit by hand. Run the script again after adding a handler.
+"""
+
+from typing import Dict
+
+'''
+
+
+def _registered_ext(node: ast.ClassDef) -> Optional[str]:
+    """
+    Returns the extension given to a @register_handler('ext') decorator on
+    a class, or None if it has none.
+    """
+    for decorator in node.decorator_list:
+        if (isinstance(decorator, ast.Call) and getattr(decorator.func, 'id', None) == 'register_handler'
+                and decorator.args and isinstance(decorator.args[0], ast.Constant)):
+            return str(decorator.args[0].value).lower()
+    return None
+
+
+def collect(plugins_dir: str = PLUGINS_DIR) -> Dict[str, str]:
+    """
+    Returns the registry entries for the handler modules in plugins_dir.
+    """
+    handlers = {}
+    for file_name in sorted(os.listdir(plugins_dir)):
+        if not file_name.endswith('_handler.py') or file_name == 'base_handler.py':
+            continue
+        module_name = file_name[:-3]
+        with open(os.path.join(plugins_dir, file_name), encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=file_name)
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(getattr(base, 'id', None) == 'FileHandler' for base in node.bases):
+                ext = _registered_ext(node) or node.name.replace('Handler', '').lower()
+                handlers.setdefault(ext, f"{module_name}:{node.name}")
+    return handlers
+
+
+def render(handlers: Dict[str, str]) -> str:
+    """
+    Returns the source of the registry module for the given entries.
+    """
+    lines = [f"    {ext!r}: {target!r},\n" for ext, target in handlers.items()]
+    return HEADER + "HANDLERS: Dict[str, str] = {\n" + ''.join(lines) + "}\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate plugins/_registry.py.")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report whether the registry is up to date.")
+    args = parser.parse_args()
+
+    source = render(collect())
+    try:
+        with open(REGISTRY_PATH, encoding='utf-8') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
+
+    if args.check:
+        if current != source:
+            print(f"{REGISTRY_PATH} is out of date; run scripts/gen_registry.py", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if current != source:
+        with open(REGISTRY_PATH, 'w', encoding='utf-8') as f:
+            f.write(source)
+        print(f"Wrote {REGISTRY_PATH}")
+
+
+if __name__ == '__main__':
+    main()
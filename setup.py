@@ -34,9 +34,16 @@ setup(
     ],
     python_requires='>=3.8',
     install_requires=requirements,
+    extras_require={
+        'dev': ['pytest', 'pytest-xdist'],
+        # Optional accelerators; the handlers fall back to slower pure-Python
+        # or stdlib code paths when they are not installed
+        'fast': ['pypdfium2>=4.0.0', 'pyarrow>=7.0.0', 'orjson>=3.0.0', 'ijson>=3.1'],
+    },
     entry_points={
         'console_scripts': [
             'fconv=main:main',
+            'fconv-batch=main:main_batch',
         ],
     },
     keywords='file converter, format conversion, csv, json, pdf, docx, pptx',
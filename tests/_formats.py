@@ -0,0 +1,7 @@
+"""
+Format lists shared by the test modules and conftest.py.
+"""
+
+# Formats whose handlers need only the required dependencies, and can
+# therefore both be looked up and write documents in every environment.
+WORKING_FORMATS = ('pdf', 'docx', 'pptx', 'ppsx')
@@ -0,0 +1,63 @@
+"""
+Shared pytest configuration for the test suite.
+
+Puts the project root on sys.path once, before any test module is imported,
+so the tests can import 'core' and 'plugins' however pytest is started,
+including from pytest-xdist worker processes (pytest -n auto).
+"""
+
+import os
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tests._formats import WORKING_FORMATS
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="also run the tests marked slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: heavy handler write tests, skipped unless --runslow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the tests marked slow unless --runslow was given.
+    """
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; run with --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def handlers():
+    """
+    The handler of each of WORKING_FORMATS, looked up once per test session
+    and shared by every test that asks for it.
+    """
+    from plugins.handler_factory import get_handler
+    return {format_name: get_handler(format_name) for format_name in WORKING_FORMATS}
+
+
+@pytest.fixture(scope="session")
+def sample_doc():
+    """
+    A short document in the intermediate format, built once per test
+    session. It is a tuple so no test can change it for the others.
+    """
+    return (
+        {'content': 'This is a test document.', 'type': 'text'},
+        {'content': 'This is another paragraph.', 'type': 'text'},
+        {'content': 'End of document.', 'type': 'text'},
+    )
@@ -1,7 +1,10 @@
 import unittest
 import os
-from plugins.handler_factory import get_handler
-from core.exceptions import UnsupportedFormatError, FileProcessingError
+import pathlib
+import tempfile
+from plugins.handler_factory import get_handler, get_handler_or_none, supports
+from plugins.base_handler import FileHandler, register_handler
+from core.exceptions import FileProcessingError
 
 class TestFileHandlers(unittest.TestCase):
     """
@@ -10,48 +13,506 @@ class TestFileHandlers(unittest.TestCase):
 
     def setUp(self):
         """
-        Setup for test cases.
+        Setup for test cases. Each test gets its own temporary file, so
+        tests can run in parallel (pytest -n auto).
         """
-        self.temp_file = "temp_test_file"
+        fd, self.temp_file = tempfile.mkstemp(prefix="temp_test_file_")
+        os.close(fd)
 
     def tearDown(self):
         """
         Clean up after tests.
         """
+        pathlib.Path(self.temp_file).unlink(missing_ok=True)
+
+    def test_pdf_read_rejects_broken_file(self):
+        with self.assertRaises(FileProcessingError):
+            get_handler('pdf').read_bytes(b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Outlines 2 0 R\n/Pages 3 0 R\n>>\nendobj\n")
+
+    def test_pdf_parallel_extraction_matches_sequential(self):
+        from reportlab.pdfgen import canvas
+        from plugins.pdf_handler import PARALLEL_MIN_PAGES, _extract_page_range, _extract_pages_parallel
+
+        page_count = PARALLEL_MIN_PAGES + 3
+        pdf = canvas.Canvas(self.temp_file)
+        for i in range(page_count):
+            pdf.drawString(72, 720, f"Page {i + 1}")
+            pdf.showPage()
+        pdf.save()
+
+        sequential = _extract_page_range(self.temp_file, 0, page_count)
+        self.assertEqual([page['content'] for page in sequential],
+                         [f"Page {i + 1}" for i in range(page_count)])
+        self.assertEqual(_extract_pages_parallel(self.temp_file, page_count), sequential)
+
+    def test_pdf_read_backends_agree(self):
+        from reportlab.pdfgen import canvas
+        import plugins.pdf_handler as pdf_handler
+
+        if pdf_handler.pdfium is None:
+            self.skipTest("pypdfium2 is not installed")
+
+        pdf = canvas.Canvas(self.temp_file)
+        pdf.drawString(72, 720, "First line")
+        pdf.drawString(72, 700, "Second line")
+        pdf.save()
+
+        handler = get_handler('pdf')
+        pages = handler.read(self.temp_file)
+        with open(self.temp_file, 'rb') as f:
+            contents = f.read()
+        pdfium = pdf_handler.pdfium
+        pdf_handler.pdfium = None
         try:
-            os.remove(self.temp_file)
-        except Exception:
+            self.assertEqual(handler.read(self.temp_file), pages)
+            self.assertEqual(handler.read_bytes(contents), pages)
+        finally:
+            pdf_handler.pdfium = pdfium
+        self.assertEqual(handler.read_bytes(contents), pages)
+        self.assertEqual(pages, [{'page': 1, 'content': 'First line\nSecond line', 'type': 'text'}])
+
+    def test_pdf_read_memory_maps_large_files(self):
+        from reportlab.pdfgen import canvas
+        import plugins.pdf_handler as pdf_handler
+
+        pdf = canvas.Canvas(self.temp_file)
+        pdf.drawString(72, 720, "Mapped")
+        pdf.save()
+
+        pdfium, threshold = pdf_handler.pdfium, pdf_handler.MMAP_THRESHOLD
+        pdf_handler.pdfium, pdf_handler.MMAP_THRESHOLD = None, 0
+        try:
+            pages = get_handler('pdf').read(self.temp_file)
+        finally:
+            pdf_handler.pdfium, pdf_handler.MMAP_THRESHOLD = pdfium, threshold
+        self.assertEqual(pages, [{'page': 1, 'content': 'Mapped', 'type': 'text'}])
+
+    def test_pptx_read_joins_shape_text(self):
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = 'Title'
+        slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame.text = '  '
+        slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame.text = ' Body '
+        slide.shapes.add_table(2, 2, 0, 0, Inches(2), Inches(1))  # No text attribute
+        presentation.save(self.temp_file)
+
+        self.assertEqual(get_handler('pptx').read(self.temp_file),
+                         [{'type': 'slide', 'number': 1, 'content': 'Title\nBody'}])
+
+    def test_mobi_module_defers_ebooklib_import(self):
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys, plugins.mobi_handler; print('ebooklib' in sys.modules)"],
+            capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
+
+    def test_ebook_lookup_skips_document_libraries(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from plugins.handler_factory import get_handler_or_none\n"
+            "get_handler_or_none('azw3'); get_handler_or_none('mobi')\n"
+            "print(sorted(m for m in ('reportlab', 'docx', 'pptx', 'PyPDF2') if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(result.stdout.strip(), '[]', result.stderr)
+
+    def test_mobi_header_metadata(self):
+        import struct
+        from io import BytesIO
+        from plugins.mobi_handler import _parse_mobi_header
+
+        name = 'Full Name'.encode('utf-8')
+        author = 'Zoë Writer'.encode('utf-8')
+        exth_record = struct.pack('>II', 100, 8 + len(author)) + author
+        exth = b'EXTH' + struct.pack('>II', 12 + len(exth_record), 1) + exth_record
+
+        mobi = bytearray(232)
+        mobi[0:4] = b'MOBI'
+        struct.pack_into('>III', mobi, 4, len(mobi), 2, 65001)
+        struct.pack_into('>II', mobi, 68, 16 + len(mobi) + len(exth), len(name))
+        struct.pack_into('>I', mobi, 112, 0x40)
+        record0 = bytes(16) + bytes(mobi) + exth + name
+
+        pdb = bytearray(78)
+        pdb[60:68] = b'BOOKMOBI'
+        struct.pack_into('>H', pdb, 76, 1)
+        book = bytes(pdb) + struct.pack('>II', 88, 0) + bytes(2) + record0
+
+        self.assertEqual(_parse_mobi_header(BytesIO(book)), {'title': 'Full Name', 'author': 'Zoë Writer'})
+        self.assertIsNone(_parse_mobi_header(BytesIO(b'not a mobi file')))
+
+    def test_azw3_calibre_falls_back_to_command(self):
+        from unittest import mock
+        import plugins.azw3_handler as azw3_handler
+
+        class ConversionUserFeedBack(Exception):
             pass
 
-    def test_pdf_handler(self):
-        handler = get_handler('pdf')
-        self.assertIsNotNone(handler)
+        plumber = mock.Mock(side_effect=ValueError("DRM-protected book"))
+        worker = azw3_handler._CalibreWorker()
+        worker._api, worker._loaded = (plumber, mock.Mock(), mock.Mock(), ConversionUserFeedBack), True
+
+        with mock.patch.object(azw3_handler, '_ebook_convert_cmd', return_value='ebook-convert'), \
+                mock.patch.object(azw3_handler, '_run_ebook_convert', return_value=True) as run:
+            with self.assertLogs(azw3_handler.log, 'WARNING'):
+                self.assertTrue(worker.convert('book.html', 'book.azw3', 30, {}))
+        run.assert_called_once()
+
+        with mock.patch.object(azw3_handler, '_ebook_convert_cmd', return_value=None):
+            with self.assertLogs(azw3_handler.log, 'WARNING'):
+                self.assertFalse(worker.convert('book.html', 'book.azw3', 30, {}))
+
+            # Anything but a conversion error is a bug, and is not hidden
+            plumber.side_effect = TypeError("bad option")
+            with self.assertRaises(TypeError):
+                worker.convert('book.html', 'book.azw3', 30, {})
+
+    def test_azw3_read_without_calibre_leaves_cache_alone(self):
+        from unittest import mock
+        import plugins.azw3_handler as azw3_handler
+
+        with tempfile.TemporaryDirectory() as cache_home, \
+                mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home}), \
+                mock.patch.object(azw3_handler._CalibreWorker, 'available', False), \
+                mock.patch.object(azw3_handler, '_file_digest') as digest:
+            records = get_handler('azw3').read(self.temp_file)
+            self.assertEqual(os.listdir(cache_home), [])
+        digest.assert_not_called()
+        self.assertEqual(records[0]['type'], 'info')
+
+    def test_ebook_html_text(self):
+        from plugins._ebook_common import _html_text
+
+        chapter = ('<?xml version="1.0" encoding="utf-8"?><html xmlns="http://www.w3.org/1999/xhtml">'
+                   '<head><title>T</title></head><body><h1>One</h1><p>Zoë &amp; two</p></body></html>')
+        self.assertEqual(_html_text(chapter.encode('utf-8')), 'TOneZoë & two')
+        self.assertEqual(_html_text(b''), '')
+
+    def test_get_handler_or_none(self):
+        self.assertIsNotNone(get_handler_or_none('csv'))
+        self.assertIsNone(get_handler_or_none('xyz'))
+
+    def test_supports(self):
+        self.assertTrue(supports('csv'))
+        self.assertTrue(supports('.JSON'))
+        self.assertFalse(supports('xyz'))
+
+    def test_factory_uses_project_classes(self):
+        import plugins.base_handler as base_handler
+        import plugins.handler_factory as handler_factory
+        import core.exceptions as exceptions
+
+        # The standalone fallbacks must not shadow the real classes, or no
+        # plugin would pass the factory's issubclass(obj, FileHandler) check
+        self.assertIs(handler_factory.FileHandler, base_handler.FileHandler)
+        self.assertIs(handler_factory.UnsupportedFormatError, exceptions.UnsupportedFormatError)
+        self.assertIsInstance(get_handler('csv'), base_handler.FileHandler)
+
+    def test_registry_entries_name_handler_classes(self):
+        import importlib
+        from plugins import HANDLERS
+
+        for ext, target in HANDLERS.items():
+            module_name, class_name = target.split(':')
+            try:
+                module = importlib.import_module(f"plugins.{module_name}")
+            except ImportError:
+                continue  # Optional dependency not installed
+            self.assertTrue(issubclass(getattr(module, class_name), FileHandler), ext)
+
+    def test_generated_registry_is_up_to_date(self):
+        import importlib.util
+
+        script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts', 'gen_registry.py')
+        spec = importlib.util.spec_from_file_location('gen_registry', script)
+        gen_registry = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(gen_registry)
+
+        with open(gen_registry.REGISTRY_PATH, encoding='utf-8') as f:
+            self.assertEqual(f.read(), gen_registry.render(gen_registry.collect()))
+
+    def test_register_handler_decorator(self):
+        import plugins.base_handler as base_handler
+        import plugins.handler_factory as handler_factory
 
-        with open(self.temp_file, 'wb') as f:
-            f.write(b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Outlines 2 0 R\n/Pages 3 0 R\n>>\nendobj\n")
+        def unregister():
+            # The registry and the factory's caches are process-wide, so
+            # leave them as they were for the other tests and later runs
+            base_handler._REGISTERED.pop('decorated', None)
+            handler_factory._RESOLVED.pop('decorated', None)
+            handler_factory._INSTANCES.pop(DecoratedHandler, None)
+            handler_factory._build_handler.cache_clear()
+
+        self.assertIsNone(get_handler_or_none('decorated'))
+
+        @register_handler('Decorated')
+        class DecoratedHandler(FileHandler):
+            def read(self, file_path): return []
+            def write(self, file_path, data): pass
+        self.addCleanup(unregister)
+
+        self.assertIsInstance(get_handler('decorated'), DecoratedHandler)
+        self.assertTrue(supports('decorated'))
+
+    def test_handler_instances_are_reused(self):
+        self.assertIs(get_handler('csv'), get_handler('CSV'))
+
+    def test_csv_write_stream_consumes_iterator(self):
+        handler = get_handler('csv')
+        rows = ({'id': str(i), 'name': f'row{i}'} for i in range(3))
+        handler.write_stream(self.temp_file, rows)
+
+        self.assertEqual(list(handler.iter_read(self.temp_file)), [
+            {'id': '0', 'name': 'row0'},
+            {'id': '1', 'name': 'row1'},
+            {'id': '2', 'name': 'row2'},
+        ])
+
+    def test_csv_iter_read_is_lazy(self):
+        handler = get_handler('csv')
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write("id,name\n1,first\n2,second\n")
+
+        rows = handler.iter_read(self.temp_file)
+        self.assertEqual(next(rows), {'id': '1', 'name': 'first'})
+        rows.close()
 
         with self.assertRaises(FileProcessingError):
-            handler.read(self.temp_file)
+            next(handler.iter_read("does_not_exist.csv"))
+
+    def test_csv_read_keeps_dictreader_semantics(self):
+        handler = get_handler('csv')
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write('id,note\n007,"two\nlines"\n2,\n3\n4,x,extra\n')
+
+        self.assertEqual(handler.read(self.temp_file), [
+            {'id': '007', 'note': 'two\nlines'},
+            {'id': '2', 'note': ''},
+            {'id': '3', 'note': None},
+            {'id': '4', 'note': 'x', None: ['extra']},
+        ])
+
+        # A byte order mark stays in the first name, and values are never
+        # type-inferred, whichever parser reads the file
+        import plugins.csv_handler as csv_handler
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write('\ufeffid,name\n1,a\n2,b\n')
+        expected_rows = [{'\ufeffid': '1', 'name': 'a'}, {'\ufeffid': '2', 'name': 'b'}]
+        self.assertEqual(handler.read(self.temp_file), expected_rows)
+        pa, csv_handler.pa = csv_handler.pa, None
+        try:
+            self.assertEqual(handler.read(self.temp_file), expected_rows)
+        finally:
+            csv_handler.pa = pa
+
+    def test_csv_read_skips_blank_lines_after_empty_header(self):
+        import csv
+        import plugins.csv_handler as csv_handler
+
+        handler = get_handler('csv')
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write('\n\n1,2\n\n')
+        with open(self.temp_file, encoding='utf-8', newline='') as f:
+            expected = list(csv.DictReader(f))
+
+        pa, csv_handler.pa = csv_handler.pa, None
+        try:
+            self.assertEqual(handler.read(self.temp_file), expected)
+        finally:
+            csv_handler.pa = pa
+
+    def test_csv_read_allows_large_fields_without_changing_limit(self):
+        import csv
+        import plugins.csv_handler as csv_handler
+
+        handler = get_handler('csv')
+        big = 'x' * (csv.field_size_limit() + 1)
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(f'id,note\n1,{big}\n')
+
+        limit = csv.field_size_limit()
+        pa, csv_handler.pa = csv_handler.pa, None
+        try:
+            rows = handler.iter_read(self.temp_file)
+            self.assertEqual(next(rows), {'id': '1', 'note': big})
+            # The limit is only lifted while rows are being parsed
+            self.assertEqual(csv.field_size_limit(), limit)
+            rows.close()
+        finally:
+            csv_handler.pa = pa
+        self.assertEqual(csv.field_size_limit(), limit)
+
+    def test_csv_read_large_fields_from_many_threads(self):
+        import csv
+        from concurrent.futures import ThreadPoolExecutor
+        import plugins.csv_handler as csv_handler
+
+        # One shared handler reads in every thread, so one reader's restore
+        # of the limit must not land while another is still parsing
+        handler = get_handler('csv')
+        big = 'x' * (csv.field_size_limit() + 1)
+        with open(self.temp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write('id,note\n')
+            for i in range(50):
+                f.write(f'{i},{big}\n')
+
+        limit = csv.field_size_limit()
+        pa, csv_handler.pa = csv_handler.pa, None
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: len(handler.read(self.temp_file)), range(32)))
+        finally:
+            csv_handler.pa = pa
+        self.assertEqual(results, [50] * 32)
+        self.assertEqual(csv.field_size_limit(), limit)
+
+    def test_json_read_streams_large_files(self):
+        import json
+        import plugins.json_handler as json_handler
+
+        records = [{'id': i, 'value': i / 2, 'tags': ['a', None]} for i in range(5)]
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f)
+
+        handler = get_handler('json')
+        self.assertEqual(handler.read(self.temp_file), records)
+
+        threshold = json_handler.STREAM_THRESHOLD
+        json_handler.STREAM_THRESHOLD = 0
+        try:
+            self.assertEqual(list(handler.iter_read(self.temp_file)), records)
+            with open(self.temp_file, 'w', encoding='utf-8') as f:
+                f.write(' {"id": 1}')
+            with self.assertRaises(FileProcessingError):
+                handler.read(self.temp_file)
+        finally:
+            json_handler.STREAM_THRESHOLD = threshold
+
+    def test_json_read_memory_maps_large_files(self):
+        import plugins.json_handler as json_handler
+
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            f.write('[{"id": 1}, NaN]')
+
+        threshold = json_handler.MMAP_THRESHOLD
+        json_handler.MMAP_THRESHOLD = 0
+        try:
+            records = get_handler('json').read(self.temp_file)
+        finally:
+            json_handler.MMAP_THRESHOLD = threshold
+        self.assertEqual(records[0], {'id': 1})
+        self.assertNotEqual(records[1], records[1])  # NaN, parsed by the json fallback
+
+    def test_json_read_rejects_non_list_root(self):
+        handler = get_handler('json')
+        for content in ('{"id": 1}', '', '[1,'):
+            with open(self.temp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            with self.assertRaises(FileProcessingError):
+                handler.read(self.temp_file)
+
+    def test_json_write_is_compact_unless_indented(self):
+        handler = get_handler('json')
+        records = [{'id': 1, 'tags': ['a']}]
+
+        handler.write(self.temp_file, records)
+        with open(self.temp_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '[{"id":1,"tags":["a"]}]')
+
+        handler.write(self.temp_file, records, indent=2)
+        with open(self.temp_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '[\n  {\n    "id": 1,\n    "tags": [\n      "a"\n    ]\n  }\n]')
+        self.assertEqual(handler.read(self.temp_file), records)
+
+    def test_json_write_batches_matches_write(self):
+        handler = get_handler('json')
+        records = [{'id': i, 'tags': ['a', None]} for i in range(5)]
+        batches = [records[:2], [], records[2:]]
+
+        for indent in (None, 2):
+            handler.write(self.temp_file, records, indent=indent)
+            with open(self.temp_file, 'rb') as f:
+                expected = f.read()
+            handler.write_batches(self.temp_file, iter(batches), indent=indent)
+            with open(self.temp_file, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+            handler.write_stream(self.temp_file, iter(records), indent=indent)
+            with open(self.temp_file, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+
+    def test_json_write_keeps_non_ascii_text(self):
+        import plugins.json_handler as json_handler
+
+        handler = get_handler('json')
+        records = [{'name': 'Zoë', 'city': 'Łódź'}]
+        dumps = json_handler._dumps
+        try:
+            for backend in (dumps, json_handler._json_dumps):
+                json_handler._dumps = backend
+                handler.write(self.temp_file, records)
+                with open(self.temp_file, encoding='utf-8') as f:
+                    self.assertEqual(f.read(), '[{"name":"Zoë","city":"Łódź"}]')
+        finally:
+            json_handler._dumps = dumps
+
+    def test_docx_read_reports_paragraph_styles(self):
+        from docx import Document
+
+        doc = Document()
+        doc.add_paragraph("Title", style="Heading 1")
+        doc.add_paragraph("Body one")
+        doc.add_paragraph("Body two")
+        doc.save(self.temp_file)
+
+        paragraphs = get_handler('docx').read(self.temp_file)
+        self.assertEqual([p['style'] for p in paragraphs], ['Heading 1', 'Normal', 'Normal'])
+        self.assertEqual([p['content'] for p in paragraphs], ['Title', 'Body one', 'Body two'])
+
+    def test_docx_read_expands_merged_table_cells(self):
+        from docx import Document
 
-    def test_docx_handler(self):
-        handler = get_handler('docx')
-        self.assertIsNotNone(handler)
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for i, cell in enumerate(table._cells):
+            cell.text = str(i)
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        doc.save(self.temp_file)
 
-    def test_pptx_handler(self):
-        handler = get_handler('pptx')
-        self.assertIsNotNone(handler)
+        tables = [item for item in get_handler('docx').read(self.temp_file) if item['type'] == 'table']
+        self.assertEqual(tables[0]['content'], [
+            ['0\n1', '0\n1', '2'],
+            ['3', '4', '5\n8'],
+            ['6', '7', '5\n8'],
+        ])
 
-    def test_ppsx_handler(self):
-        handler = get_handler('ppsx')
-        self.assertIsNotNone(handler)
+    def test_docx_read_table_cell_tabs_and_breaks(self):
+        from docx import Document
+        from docx.enum.text import WD_BREAK
 
-    def test_azw3_handler(self):
-        with self.assertRaises(UnsupportedFormatError):
-            get_handler('azw3')
+        doc = Document()
+        run = doc.add_table(rows=1, cols=1).cell(0, 0).paragraphs[0].add_run('a\tb')
+        run.add_break()
+        run.add_text('c')
+        run.add_break(WD_BREAK.PAGE)
+        doc.save(self.temp_file)
 
-    def test_mobi_handler(self):
-        with self.assertRaises(UnsupportedFormatError):
-            get_handler('mobi')
+        tables = [item for item in get_handler('docx').read(self.temp_file) if item['type'] == 'table']
+        self.assertEqual(tables[0]['content'], [['a\tb\nc']])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from core.orchestrator import _format_of, convert_file, convert_many, make_converter
+from core.exceptions import ConversionError, FileProcessingError
+
+
+class TestOrchestrator(unittest.TestCase):
+    """
+    Tests the conversion orchestration helpers.
+    """
+
+    def test_format_of(self):
+        self.assertEqual(_format_of("data/Input.CSV"), "csv")
+        self.assertEqual(_format_of("archive.tar.gz"), "gz")
+        self.assertEqual(_format_of("no_extension"), "")
+        self.assertEqual(_format_of("release.v2/no_extension"), "")
+
+    def test_missing_input_fails_before_handler_lookup(self):
+        with self.assertRaises(FileProcessingError):
+            convert_file("does_not_exist.csv", "output.json")
+
+    def test_same_format_is_copied_verbatim(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "in.csv")
+            target = os.path.join(tmp_dir, "out.csv")
+            with open(source, "wb") as f:
+                f.write(b"a,b\n1,2\n")
+
+            convert_file(source, target)
+
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"a,b\n1,2\n")
+
+    def test_make_converter_reuses_plan(self):
+        run = make_converter('csv', '.json')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "in.csv")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("a,b\n1,2\n")
+
+            for name in ("one.json", "two.json"):
+                run(source, os.path.join(tmp_dir, name))
+                self.assertTrue(os.path.exists(os.path.join(tmp_dir, name)))
+
+    def test_make_converter_rejects_unsupported_format(self):
+        with self.assertRaises(ConversionError):
+            make_converter('csv', 'xyz')
+
+    def test_missing_plugin_dependencies_are_reported(self):
+        import sys
+        from unittest import mock
+        import plugins.handler_factory as handler_factory
+
+        def clear_caches():
+            handler_factory._RESOLVED.clear()
+            handler_factory._build_handler.cache_clear()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+        # A None entry makes importing the plugin fail, as a missing
+        # dependency would
+        with mock.patch.dict(sys.modules, {'plugins.pptx_handler': None}):
+            self.assertTrue(handler_factory.supports('pptx'))
+            self.assertIsNone(handler_factory.get_handler_or_none('pptx'))
+            with self.assertRaisesRegex(ConversionError, "could not be loaded"):
+                make_converter('csv', 'pptx')
+
+    def test_convert_many_reports_each_job_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "in.csv")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("a,b\n1,2\n")
+
+            jobs = [(source, os.path.join(tmp_dir, f"out{i}.json")) for i in range(4)]
+            jobs.insert(2, (os.path.join(tmp_dir, "missing.csv"), os.path.join(tmp_dir, "missing.json")))
+
+            for workers in (1, 2):
+                errors = list(convert_many(jobs, workers=workers))
+                self.assertEqual([error is None for error in errors], [True, True, False, True, True])
+                self.assertIn("Input file does not exist", errors[2])
+                for _, target in jobs[:2] + jobs[3:]:
+                    self.assertTrue(os.path.exists(target))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import unittest
+from unittest import mock
+from core import parallel
+from core.parallel import process_map
+
+
+def _fail_in_worker(n, parent_pid):
+    """
+    Raises FileNotFoundError for n == 3, but only in a worker process.
+    """
+    if n == 3 and os.getpid() != parent_pid:
+        raise FileNotFoundError(n)
+    return n
+
+
+def _pid(_):
+    return os.getpid()
+
+
+def _nested_calls_stay_in_process(_):
+    """
+    Runs a nested process_map() and reports whether it stayed in this worker.
+    """
+    return set(process_map(_pid, range(4), workers=2)) == {os.getpid()}
+
+
+class TestProcessMap(unittest.TestCase):
+    """
+    Tests the process pool helper.
+    """
+
+    def test_results_keep_input_order(self):
+        results = process_map(divmod, range(20, 40), [3] * 20, workers=2)
+        self.assertEqual(list(results), [divmod(n, 3) for n in range(20, 40)])
+
+    def test_small_batches_run_in_this_process(self):
+        with mock.patch.object(parallel, 'ProcessPoolExecutor') as executor:
+            self.assertEqual(list(process_map(abs, [-1, -2], min_jobs=3, workers=2)), [1, 2])
+            self.assertEqual(list(process_map(abs, [-1, -2, -3], workers=1)), [1, 2, 3])
+        executor.assert_not_called()
+
+    def test_falls_back_when_workers_cannot_start(self):
+        with mock.patch.object(parallel, 'ProcessPoolExecutor', side_effect=OSError):
+            self.assertEqual(list(process_map(abs, [-1, -2, -3], workers=2)), [1, 2, 3])
+
+    def test_errors_from_workers_propagate(self):
+        results = process_map(_fail_in_worker, range(6), [os.getpid()] * 6, workers=2)
+        self.assertEqual([next(results) for _ in range(3)], [0, 1, 2])
+        # Not taken for a failure to start the workers, and rerun here
+        with self.assertRaises(FileNotFoundError):
+            next(results)
+
+    def test_workers_do_not_start_nested_pools(self):
+        self.assertEqual(list(process_map(_nested_calls_stay_in_process, range(2), workers=2)), [True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()